@@ -1,8 +1,37 @@
 from django.contrib import admin
+from django.contrib.admin.views.main import ChangeList
 
 from .models import Brand, CustomUser, Item, Manufacturer
 
-admin.site.register(CustomUser)
-admin.site.register(Item)
-admin.site.register(Brand)
-admin.site.register(Manufacturer)
+
+class CustomUserAdmin(admin.ModelAdmin):
+    list_display = ("email", "is_staff", "is_active", "date_joined")
+    search_fields = ("email",)
+
+
+class ItemChangeList(ChangeList):
+    def get_queryset(self, request):
+        # Rows never render the description, so skip loading its text
+        return super().get_queryset(request).defer("description")
+
+
+class ItemAdmin(admin.ModelAdmin):
+    list_display = ("title", "barcode", "alias")
+    search_fields = ("title", "barcode", "alias")
+
+    def get_changelist(self, request, **kwargs):
+        return ItemChangeList
+
+
+class BrandAdmin(admin.ModelAdmin):
+    search_fields = ("name",)
+
+
+class ManufacturerAdmin(admin.ModelAdmin):
+    search_fields = ("name",)
+
+
+admin.site.register(CustomUser, CustomUserAdmin)
+admin.site.register(Item, ItemAdmin)
+admin.site.register(Brand, BrandAdmin)
+admin.site.register(Manufacturer, ManufacturerAdmin)
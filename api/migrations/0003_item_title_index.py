@@ -0,0 +1,17 @@
+# Generated by Django 4.2 on 2026-10-16 02:35
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("api", "0002_brand_item_manufacturer"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="item",
+            index=models.Index(fields=["title"], name="api_item_title_f02de9_idx"),
+        ),
+    ]
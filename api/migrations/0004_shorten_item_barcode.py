@@ -0,0 +1,37 @@
+# Generated by Django 4.2 on 2026-10-16 02:36
+
+from django.db import migrations, models
+from django.db.models.functions import Length
+
+BARCODE_MAX_LENGTH = 14
+
+
+def check_barcode_lengths(apps, schema_editor):
+    """Refuse to migrate while any barcode is longer than the new column."""
+    Item = apps.get_model("api", "Item")
+    too_long = list(
+        Item.objects.annotate(barcode_length=Length("barcode"))
+        .filter(barcode_length__gt=BARCODE_MAX_LENGTH)
+        .values_list("barcode", flat=True)
+    )
+    if too_long:
+        raise ValueError(
+            f"Items with barcodes longer than {BARCODE_MAX_LENGTH} characters "
+            f"must be fixed or removed before migrating: {', '.join(too_long)}"
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("api", "0003_item_title_index"),
+    ]
+
+    operations = [
+        migrations.RunPython(check_barcode_lengths, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name="item",
+            name="barcode",
+            field=models.CharField(max_length=BARCODE_MAX_LENGTH, unique=True),
+        ),
+    ]
@@ -13,7 +13,8 @@ class Item(models.Model):
     - description (str): Detailed description of the item
     """
 
-    barcode = models.CharField(max_length=255, unique=True)
+    # UPC/EAN/GTIN codes are at most 14 digits
+    barcode = models.CharField(max_length=14, unique=True)
     title = models.CharField(max_length=255)
     alias = models.CharField(max_length=255, blank=True)
     description = models.TextField(blank=True)
@@ -23,3 +24,4 @@ class Item(models.Model):
 
     class Meta:
         ordering = ["title"]
+        indexes = [models.Index(fields=["title"])]
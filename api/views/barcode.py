@@ -1,13 +1,42 @@
 import base64
+import hashlib
 import io
+import re
+from functools import lru_cache
 
 import google.generativeai as genai
 from django.conf import settings
+from django.core.cache import cache
 from PIL import Image
 from rest_framework import status, viewsets
 from rest_framework.decorators import action
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
+from rest_framework.throttling import UserRateThrottle
+
+# Camera captures are JPEG; skip probing for every other format PIL supports
+IMAGE_FORMATS = ("JPEG", "PNG")
+
+# Longest edge sent to Gemini; larger captures only add upload size and tokens
+MAX_IMAGE_SIZE = (1024, 1024)
+
+# UPC/EAN/GTIN codes are 8 to 14 digits; Gemini sometimes wraps them in prose
+BARCODE_PATTERN = re.compile(r"\b\d{8,14}\b")
+
+# Printed codes are often grouped, e.g. "0 12345 67890 5" or "0-12345-67890-5"
+BARCODE_SEPARATOR_PATTERN = re.compile(r"(?<=\d)[ -](?=\d)")
+
+# How long a processed image's result is reused for identical resubmissions
+BARCODE_CACHE_TIMEOUT = 60 * 10
+
+
+@lru_cache(maxsize=1)
+def _get_model():
+    """Configure Gemini once and return a shared model instance."""
+    api_key = getattr(settings, "GEMINI_API_KEY", None)
+    if api_key:
+        genai.configure(api_key=api_key)
+    return genai.GenerativeModel("gemini-2.0-flash")
 
 
 class BarcodeViewSet(viewsets.ViewSet):
@@ -19,14 +48,7 @@ class BarcodeViewSet(viewsets.ViewSet):
     """
 
     permission_classes = [IsAuthenticated]
-
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        # Initialize Gemini API
-        api_key = getattr(settings, "GEMINI_API_KEY", None)
-        if api_key:
-            genai.configure(api_key=api_key)
-        self.model = genai.GenerativeModel("gemini-2.0-flash")
+    throttle_classes = [UserRateThrottle]
 
     @action(detail=False, methods=["post"])
     def process(self, request):
@@ -34,22 +56,45 @@ class BarcodeViewSet(viewsets.ViewSet):
         Process a barcode image and extract the numerical code.
 
         POST /api/barcode/process/
-        - image: base64 encoded image data
+        - image: base64 encoded image data, or an uploaded image file
+          (multipart/form-data)
 
         Returns: { "barcode_code": "extracted_code" }
         """
         try:
-            image_data = request.data.get("image")
-            if not image_data:
+            image_file = request.FILES.get("image")
+            image_data = None if image_file else request.data.get("image")
+            if not image_file and not image_data:
                 return Response(
                     {"error": "No image provided"},
                     status=status.HTTP_400_BAD_REQUEST,
                 )
 
-            # Decode base64 image
+            # Read uploads as-is, otherwise decode the base64 payload
+            try:
+                if image_file:
+                    image_bytes = image_file.read()
+                else:
+                    image_bytes = base64.b64decode(image_data)
+            except Exception as e:
+                return Response(
+                    {"error": f"Invalid image format: {str(e)}"},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+
+            # Retried submissions of the same image reuse the earlier result
+            digest = hashlib.blake2b(image_bytes, digest_size=16).hexdigest()
+            cache_key = f"barcode:{digest}"
+            cached_result = cache.get(cache_key)
+            if cached_result is not None:
+                return Response(cached_result, status=status.HTTP_200_OK)
+
             try:
-                image_bytes = base64.b64decode(image_data)
-                image = Image.open(io.BytesIO(image_bytes))
+                image = Image.open(io.BytesIO(image_bytes), formats=IMAGE_FORMATS)
+
+                # Downscale and drop colour before upload; digits stay legible
+                image.thumbnail(MAX_IMAGE_SIZE, Image.Resampling.LANCZOS)
+                image = image.convert("L")
             except Exception as e:
                 return Response(
                     {"error": f"Invalid image format: {str(e)}"},
@@ -61,19 +106,21 @@ class BarcodeViewSet(viewsets.ViewSet):
             Return ONLY the numerical code of the barcode, nothing else.
             If there is no barcode or the code cannot be extracted, respond with "UNABLE_TO_READ"."""
 
-            response = self.model.generate_content([prompt, image])
-            barcode_code = response.text.strip()
+            response = _get_model().generate_content([prompt, image])
+            text = BARCODE_SEPARATOR_PATTERN.sub("", response.text)
+            match = BARCODE_PATTERN.search(text)
 
             # Determine if barcode was detected
-            detected = barcode_code != "UNABLE_TO_READ"
+            detected = match is not None
+            barcode_code = match.group(0) if detected else "UNABLE_TO_READ"
 
-            return Response(
-                {
-                    "barcode_code": barcode_code,
-                    "detected": detected,
-                },
-                status=status.HTTP_200_OK,
-            )
+            result = {
+                "barcode_code": barcode_code,
+                "detected": detected,
+            }
+            cache.set(cache_key, result, BARCODE_CACHE_TIMEOUT)
+
+            return Response(result, status=status.HTTP_200_OK)
 
         except Exception as e:
             return Response(
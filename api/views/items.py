@@ -1,5 +1,10 @@
+import logging
+from functools import lru_cache
+
 import upcdatabase
 from decouple import config
+from django.core.cache import cache
+from django.db import transaction
 from rest_framework import status, viewsets
 from rest_framework.decorators import action
 from rest_framework.permissions import IsAuthenticated
@@ -8,6 +13,78 @@ from rest_framework.response import Response
 from ..models import Brand, Item
 from ..serializers import ItemSerializer
 
+logger = logging.getLogger(__name__)
+
+# UPC data is effectively static, so external lookups can be cached for a while
+UPC_CACHE_TIMEOUT = 60 * 60 * 24 * 7
+
+# Unknown UPCs may be added to the external database later, so retry sooner
+UPC_MISS_CACHE_TIMEOUT = 60 * 60
+
+# The client raises UPCDatabaseError for every failure and only reports the
+# HTTP status in the message, so unknown UPCs are told apart by this prefix
+UPC_NOT_FOUND_ERROR = "API request failed: 404"
+
+# Upper bound on the items accepted by one bulk create request
+BULK_CREATE_MAX_ITEMS = 100
+
+
+@lru_cache(maxsize=1)
+def _get_upc_client():
+    """
+    Return a shared UPCDatabase client, or None if no API key is configured.
+
+    The client holds a requests session, so reusing it keeps the connection
+    to the external API alive across lookups.
+    """
+    api_key = config("UPCDATABASE_API_KEY", default="")
+    if not api_key:
+        return None
+    return upcdatabase.UPCDatabase(api_key)
+
+
+def _cached_lookup(db, upc):
+    """
+    Lookup a UPC through the Django cache before hitting the external API.
+
+    Unknown UPCs, which the client reports as a 404 error, and lookups that
+    answer with success false are stored as an empty string for a shorter
+    time so repeated scans of unknown products are served from the cache
+    too. Any other error is raised and nothing is cached.
+    """
+    key = f"upc:{upc}"
+    product = cache.get(key)
+    if product is None:
+        try:
+            product = db.lookup(upc)
+        except upcdatabase.UPCDatabaseError as e:
+            if not str(e).startswith(UPC_NOT_FOUND_ERROR):
+                raise
+            product = None
+
+        # Only successful lookups are products; failures are stored as misses
+        if not product or not product.get("success"):
+            product = ""
+        timeout = UPC_CACHE_TIMEOUT if product else UPC_MISS_CACHE_TIMEOUT
+        cache.set(key, product, timeout)
+    return product or None
+
+
+def _lookup_external(upc):
+    """
+    Lookup a UPC in the external database.
+
+    Returns a (product, error_response) pair. product is None when the UPC
+    is unknown, and error_response is set when no API key is configured.
+    """
+    db = _get_upc_client()
+    if db is None:
+        return None, Response(
+            {"error": "UPCDATABASE_API_KEY environment variable not set"},
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        )
+    return _cached_lookup(db, upc), None
+
 
 class ItemViewSet(viewsets.ViewSet):
     """
@@ -15,6 +92,7 @@ class ItemViewSet(viewsets.ViewSet):
 
     Provides the following endpoints:
     - POST /api/items/ - Create item from UPC data
+    - POST /api/items/bulk/ - Create many items from UPC data at once
     - GET /api/items/lookup-product/{upc}/ - Lookup product data from external database
     - GET /api/items/{upc}/ - Lookup and create item from UPC (deprecated)
 
@@ -47,6 +125,12 @@ class ItemViewSet(viewsets.ViewSet):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
+        if len(barcode) > Item._meta.get_field("barcode").max_length:
+            return Response(
+                {"barcode": "Barcode is too long"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
         if not title:
             return Response(
                 {"title": "Title is required"},
@@ -54,8 +138,8 @@ class ItemViewSet(viewsets.ViewSet):
             )
 
         try:
-            # Create or get the item
-            item, created = Item.objects.get_or_create(
+            # Create the item, or update its fields if it already exists
+            item, created = Item.objects.update_or_create(
                 barcode=barcode,
                 defaults={
                     "title": title,
@@ -64,13 +148,6 @@ class ItemViewSet(viewsets.ViewSet):
                 },
             )
 
-            # If item already existed, optionally update fields
-            if not created:
-                item.title = title
-                item.description = description
-                item.alias = alias
-                item.save()
-
             serializer = ItemSerializer(item)
             return Response(
                 serializer.data,
@@ -83,6 +160,107 @@ class ItemViewSet(viewsets.ViewSet):
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR,
             )
 
+    @action(detail=False, methods=["post"], url_path="bulk")
+    def bulk_create(self, request):
+        """
+        Create many items in the database with a fixed number of queries.
+
+        POST /api/items/bulk/
+        - list of up to BULK_CREATE_MAX_ITEMS objects with the same fields as
+          POST /api/items/
+
+        Barcodes that already exist are left unchanged.
+
+        Returns: List of item objects for the submitted barcodes, with 201 if
+        any item was created and 200 otherwise
+        """
+        entries = request.data
+        if (
+            not isinstance(entries, list)
+            or not entries
+            or not all(isinstance(entry, dict) for entry in entries)
+        ):
+            return Response(
+                {"error": "A list of items is required"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        if len(entries) > BULK_CREATE_MAX_ITEMS:
+            return Response(
+                {"error": f"At most {BULK_CREATE_MAX_ITEMS} items are allowed"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        max_length = Item._meta.get_field("barcode").max_length
+        items = {}
+        for entry in entries:
+            fields = {
+                "barcode": entry.get("barcode", ""),
+                "title": entry.get("title", ""),
+                "description": entry.get("description", ""),
+                "alias": entry.get("alias", ""),
+            }
+
+            # Reject nulls and numbers rather than storing them as "None" or "123"
+            for name, value in fields.items():
+                if not isinstance(value, str):
+                    return Response(
+                        {name: f"{name.capitalize()} must be a string"},
+                        status=status.HTTP_400_BAD_REQUEST,
+                    )
+                fields[name] = value.strip()
+
+            barcode = fields["barcode"]
+
+            # Validate required fields
+            if not barcode:
+                return Response(
+                    {"barcode": "Barcode is required"},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+
+            if len(barcode) > max_length:
+                return Response(
+                    {"barcode": f"Barcode is too long: {barcode}"},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+
+            if not fields["title"]:
+                return Response(
+                    {"title": f"Title is required for barcode: {barcode}"},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+
+            # Later entries for the same barcode replace earlier ones
+            items[barcode] = Item(**fields)
+
+        try:
+            existing = set(
+                Item.objects.filter(barcode__in=items.keys()).values_list(
+                    "barcode", flat=True
+                )
+            )
+            new_items = [
+                item for barcode, item in items.items() if barcode not in existing
+            ]
+            if new_items:
+                # Rows inserted concurrently since the check above are skipped
+                Item.objects.bulk_create(new_items, ignore_conflicts=True)
+
+            # Conflicting rows come back without IDs, so re-read them all
+            created_items = Item.objects.filter(barcode__in=items.keys())
+            serializer = ItemSerializer(created_items, many=True)
+            return Response(
+                serializer.data,
+                status=status.HTTP_201_CREATED if new_items else status.HTTP_200_OK,
+            )
+
+        except Exception as e:
+            return Response(
+                {"error": f"Failed to create items: {str(e)}"},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
     @action(detail=False, methods=["get"], url_path="lookup-product/(?P<upc>[^/.]+)")
     def lookup_product(self, request, upc=None):
         """
@@ -98,6 +276,12 @@ class ItemViewSet(viewsets.ViewSet):
                 {"error": "UPC code is required"}, status=status.HTTP_400_BAD_REQUEST
             )
 
+        # Reject codes the barcode column cannot hold before calling the external API
+        if len(upc) > Item._meta.get_field("barcode").max_length:
+            return Response(
+                {"error": "UPC code is too long"}, status=status.HTTP_400_BAD_REQUEST
+            )
+
         # First, check if item exists in database
         try:
             item = Item.objects.get(barcode=upc)
@@ -117,17 +301,9 @@ class ItemViewSet(viewsets.ViewSet):
         except Item.DoesNotExist:
             # Item not in database, proceed to external API lookup
             try:
-                # Get API key from environment
-                api_key = config("UPCDATABASE_API_KEY", default="")
-                if not api_key:
-                    return Response(
-                        {"error": "UPCDATABASE_API_KEY environment variable not set"},
-                        status=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    )
-
-                # Create UPCDatabase instance and lookup the UPC
-                db = upcdatabase.UPCDatabase(api_key)
-                product = db.lookup(upc)
+                product, error_response = _lookup_external(upc)
+                if error_response is not None:
+                    return error_response
 
                 if not product:
                     # Product not found is not an error - return success with found=false
@@ -171,18 +347,16 @@ class ItemViewSet(viewsets.ViewSet):
                 {"error": "UPC code is required"}, status=status.HTTP_400_BAD_REQUEST
             )
 
-        try:
-            # Get API key from environment
-            api_key = config("UPCDATABASE_API_KEY", default="")
-            if not api_key:
-                return Response(
-                    {"error": "UPCDATABASE_API_KEY environment variable not set"},
-                    status=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                )
+        # Reject codes the barcode column cannot hold before calling the external API
+        if len(upc) > Item._meta.get_field("barcode").max_length:
+            return Response(
+                {"error": "UPC code is too long"}, status=status.HTTP_400_BAD_REQUEST
+            )
 
-            # Create UPCDatabase instance and lookup the UPC
-            db = upcdatabase.UPCDatabase(api_key)
-            product = db.lookup(upc)
+        try:
+            product, error_response = _lookup_external(upc)
+            if error_response is not None:
+                return error_response
 
             if not product:
                 return Response(
@@ -190,28 +364,30 @@ class ItemViewSet(viewsets.ViewSet):
                     status=status.HTTP_404_NOT_FOUND,
                 )
 
-            print(f"UPC Lookup Result: {product}")
+            logger.debug(
+                "UPC lookup result for %s: %s", upc, product, extra={"upc": upc}
+            )
 
             # Extract product information
             title = product.get("title", "Unknown")
             brand_name = product.get("brand", "")
             description = product.get("description", "")
 
-            # Create or get brand
-            brand = None
-            if brand_name:
-                brand, _ = Brand.objects.get_or_create(name=brand_name)
+            # Create or get brand and item in a single transaction
+            with transaction.atomic():
+                brand = None
+                if brand_name:
+                    brand, _ = Brand.objects.get_or_create(name=brand_name)
 
-            # Create or get item
-            item, created = Item.objects.get_or_create(
-                barcode=upc,
-                defaults={"title": title, "description": description, "alias": ""},
-            )
+                item, created = Item.objects.get_or_create(
+                    barcode=upc,
+                    defaults={"title": title, "description": description, "alias": ""},
+                )
 
             if created:
-                print(f"Created new item: {item}")
+                logger.debug("Created new item: %s", item, extra={"upc": upc})
             else:
-                print(f"Item already exists: {item}")
+                logger.debug("Item already exists: %s", item, extra={"upc": upc})
 
             serializer = ItemSerializer(item)
             return Response(
@@ -220,7 +396,7 @@ class ItemViewSet(viewsets.ViewSet):
             )
 
         except Exception as e:
-            print(f"Error looking up UPC {upc}: {str(e)}")
+            logger.error("Error looking up UPC %s: %s", upc, e, extra={"upc": upc})
             return Response(
                 {"error": f"Failed to lookup UPC: {str(e)}"},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR,
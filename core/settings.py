@@ -125,6 +125,9 @@ REST_FRAMEWORK = {
     "DEFAULT_PERMISSION_CLASSES": [
         "rest_framework.permissions.AllowAny",
     ],
+    "DEFAULT_THROTTLE_RATES": {
+        "user": "60/min",
+    },
 }
 
 SIMPLE_JWT = {
@@ -59,7 +59,10 @@ VALID_TYPES = {
 # Rules
 MAX_HEADER_LENGTH = 50
 MAX_BODY_LINE_LENGTH = 72
-BREAKING_CHANGE_PATTERN = r"^BREAKING[\s-]CHANGE"
+BREAKING_CHANGE_PATTERN = re.compile(r"^BREAKING[\s-]CHANGE")
+
+# Header format: type(scope): subject
+HEADER_PATTERN = re.compile(r"^(\w+)(?:\(([^)]*)\))?!?:\s(.+)$")
 
 
 def validate_commit_message(message: str) -> tuple[bool, str]:
@@ -77,13 +80,12 @@ def validate_commit_message(message: str) -> tuple[bool, str]:
         - is_valid: Boolean indicating if the message passed all checks
         - error_message: Detailed error message if validation failed, empty string if valid
     """
-    # Remove git comment lines (starting with #) which are ignored by git
-    lines_raw = message.split("\n")
-    lines = [line for line in lines_raw if not line.startswith("#")]
-
-    # Rejoin and strip leading/trailing whitespace
-    message_clean = "\n".join(lines).strip()
-    lines = message_clean.split("\n")
+    # Remove git comment lines (starting with #) which are ignored by git,
+    # then strip leading/trailing whitespace from what is left
+    message_clean = "\n".join(
+        line for line in message.splitlines() if not line.startswith("#")
+    ).strip()
+    lines = message_clean.splitlines()
 
     if not lines:
         return False, "Commit message cannot be empty"
@@ -91,7 +93,7 @@ def validate_commit_message(message: str) -> tuple[bool, str]:
     header = lines[0]
 
     # Parse header: type(scope): subject
-    match = re.match(r"^(\w+)(?:\(([^)]*)\))?!?:\s(.+)$", header)
+    match = HEADER_PATTERN.match(header)
     if not match:
         return False, (
             "Invalid commit message format.\n"
@@ -136,8 +138,8 @@ def validate_commit_message(message: str) -> tuple[bool, str]:
     if lines[1].strip() != "":
         return False, "There must be a blank line between subject and body"
 
-    # Validate body is not empty
-    body = "\n".join(lines[2:]).strip()
+    # Validate body is not empty (everything after the header and blank line)
+    body = message_clean.partition("\n")[2].lstrip()
     if not body:
         return False, "Commit body cannot be empty"
 
@@ -146,11 +148,10 @@ def validate_commit_message(message: str) -> tuple[bool, str]:
         return False, "Commit body must end with a period"
 
     # Validate body line length
-    body_lines = lines[2:]
-    for i, line in enumerate(body_lines, start=1):
+    for i, line in enumerate(lines[2:], start=3):
         if len(line) > MAX_BODY_LINE_LENGTH:
             return False, (
-                f"Line {i + 2} of commit message is too long ({len(line)} > {MAX_BODY_LINE_LENGTH})\n"
+                f"Line {i} of commit message is too long ({len(line)} > {MAX_BODY_LINE_LENGTH})\n"
                 f"Body line: {line[:50]}...\n"
                 f"Maximum line length is {MAX_BODY_LINE_LENGTH} characters"
             )
@@ -5,9 +5,11 @@ This file sets up Django and imports all fixtures from the fixtures module.
 """
 
 import os
+import socket
 
 import django
 import pytest
+from django.conf import settings
 
 # Setup Django
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "core.settings")
@@ -21,19 +23,33 @@ django.setup()
 DJANGO_HOST = os.getenv("DJANGO_TEST_HOST", "http://localhost:8000")
 FRONTEND_HOST = os.getenv("FRONTEND_TEST_HOST", "http://localhost:3000")
 
+# Hash strength doesn't matter for test users; skip PBKDF2's slow iterations
+settings.PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
+
+# The UPC database client is always mocked, but the views refuse to build it
+# without a key
+os.environ.setdefault("UPCDATABASE_API_KEY", "test-key")
+
 
 # ============================================================================
 # Import all fixtures
 # ============================================================================
 
 from .fixtures.browser import (  # noqa: E402, F401
+    _session_auth_state,
     auth_storage_state,
     authenticated_page,
     browser,
     browser_context,
+    event_loop,
+    mock_barcode_api,
+    mock_item_lookup,
+    shared_authenticated_page,
+    shared_browser_context,
     unauthenticated_browser_context,
     unauthenticated_page,
 )
+from .fixtures.cache import reset_caches  # noqa: E402, F401
 from .fixtures.database import db_reset  # noqa: E402, F401
 from .fixtures.http import authenticated_client, http_client  # noqa: E402, F401
 from .fixtures.users import (  # noqa: E402, F401
@@ -52,53 +68,44 @@ from .fixtures.utils import (  # noqa: E402, F401
 # ============================================================================
 
 
-def _check_server_available(host: str, port: int, timeout: int = 2) -> bool:
-    """Check if a server is available by attempting an HTTP request."""
-    import urllib.error
-    import urllib.request
-
-    url = f"http://{host}:{port}/"
-
+def _check_server_available(host: str, port: int, timeout: float = 2) -> bool:
+    """Check if a server is available by opening a TCP connection to it."""
     try:
-        # Try HTTP request (more reliable for checking actual service)
-        response = urllib.request.urlopen(url, timeout=timeout)
-        response.close()
-        return True
-    except (
-        urllib.error.URLError,
-        urllib.error.HTTPError,
-        TimeoutError,
-        Exception,
-    ):
-        # Server not responding
+        # A bare connect is enough to tell whether anything is listening
+        with socket.create_connection((host, port), timeout=timeout):
+            return True
+    except OSError:
+        # Server not responding (TimeoutError is an OSError)
         return False
 
 
-def pytest_configure(config):
-    """Configure pytest and set up markers for skipping e2e tests if needed."""
-    # Check server availability
-    frontend_parts = (
-        FRONTEND_HOST.replace("http://", "").replace("https://", "").split(":")
-    )
-    frontend_port = int(frontend_parts[-1]) if len(frontend_parts) > 1 else 3000
-    frontend_available = _check_server_available(
-        frontend_parts[0], frontend_port, timeout=1
-    )
+def _host_available(url: str, default_port: int) -> bool:
+    """Check whether the server at the given base URL is up."""
+    host_parts = url.replace("http://", "").replace("https://", "").split(":")
+    port = int(host_parts[-1]) if len(host_parts) > 1 else default_port
+    # Refused connections return at once; the timeout only covers unroutable hosts
+    return _check_server_available(host_parts[0], port, timeout=0.2)
+
 
-    config._frontend_available = frontend_available
+def _servers_available() -> bool:
+    """Check whether both servers the E2E tests talk to are up."""
+    return _host_available(FRONTEND_HOST, 3000) and _host_available(DJANGO_HOST, 8000)
 
 
 def pytest_collection_modifyitems(config, items):
-    """Skip E2E tests if frontend server is not available."""
-    if not hasattr(config, "_frontend_available") or config._frontend_available:
+    """Skip browser tests if the frontend or Django server is not available."""
+    # Every page and context fixture builds on the browser fixture, so this
+    # leaves out E2E module tests that only use the test client and mocks
+    browser_tests = [item for item in items if "browser" in item.fixturenames]
+
+    # Only probe the servers when the selected tests actually need them
+    if not browser_tests or _servers_available():
         return
 
-    # Frontend not available, skip e2e tests
+    # A server is not available, skip browser tests
     skip_marker = pytest.mark.skip(
-        reason="Frontend server not available. Run: make run-frontend"
+        reason="Servers not available. Run: make run-backend && make run-frontend"
     )
 
-    e2e_tests = [item for item in items if "e2e" in item.nodeid]
-
-    for item in e2e_tests:
+    for item in browser_tests:
         item.add_marker(skip_marker)
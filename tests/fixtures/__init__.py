@@ -1 +1,6 @@
 """Pytest fixtures for tests."""
+
+from django.contrib.auth import get_user_model
+
+# Resolved once here and shared by every fixture module
+User = get_user_model()
@@ -1,119 +1,154 @@
 """Browser fixtures for E2E testing."""
 
+import asyncio
+import json
+import os
+import time
+
 import pytest
-from asgiref.sync import sync_to_async
-from django.contrib.auth import get_user_model
-from playwright.async_api import Browser, BrowserContext
+from playwright.async_api import Browser, BrowserContext, async_playwright
+from rest_framework_simplejwt.tokens import RefreshToken
 
-User = get_user_model()
+from . import User
 
+CHROMIUM_ARGS = [
+    "--use-fake-ui-for-media-stream",  # Use fake camera/mic
+    "--use-fake-device-for-media-stream",  # Provide fake media devices
+    "--disable-dev-shm-usage",  # Small /dev/shm in CI containers stalls Chromium
+]
 
-@pytest.fixture
-async def browser() -> Browser:
-    """Provide a browser instance for E2E tests."""
-    from playwright.async_api import async_playwright
-
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(
-            headless=True,
-            args=[
-                "--use-fake-ui-for-media-stream",  # Use fake camera/mic
-                "--use-fake-device-for-media-stream",  # Provide fake media devices
-            ],
-        )
-        yield browser
-        await browser.close()
+# Fail fast on missing elements, but give a cold dev server time to compile
+ACTION_TIMEOUT = 5000
+NAVIGATION_TIMEOUT = 30000
 
 
-@pytest.fixture
-async def auth_storage_state(browser: Browser, db, test_dir, request) -> dict:
+@pytest.fixture(scope="session")
+def event_loop():
     """
-    Create and save authenticated storage state for E2E tests.
-    This creates a test user and sets auth tokens in localStorage.
+    Share one event loop across the session.
+
+    Playwright objects are bound to the loop they were created on, so the
+    session-scoped browser and every async test must run on the same loop.
     """
-    # Create a temporary context to set up auth state
-    context = await browser.new_context()
-    page = await context.new_page()
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
 
-    try:
-        # Create test user in the database using a unique email
-        # Use the test name to ensure uniqueness
-        test_name = request.node.name if request else "default"
-        unique_email = f"auth_user_{test_name}@example.com"
 
-        # Clean up any existing user with this email
-        await sync_to_async(User.objects.filter(email=unique_email).delete)()
+async def _launch_browser():
+    """Start Playwright and launch Chromium."""
+    playwright = await async_playwright().start()
+    browser = await playwright.chromium.launch(headless=True, args=CHROMIUM_ARGS)
+    return playwright, browser
+
+
+async def _close_browser(playwright, browser: Browser):
+    """Close the browser and stop Playwright."""
+    await browser.close()
+    await playwright.stop()
+
+
+@pytest.fixture(scope="session")
+def browser(event_loop) -> Browser:
+    """
+    Provide a browser instance shared by all E2E tests.
+
+    Launching Chromium is the slowest part of the E2E setup, so it happens
+    once per session. Tests stay isolated through their own contexts.
+    """
+    playwright, browser = event_loop.run_until_complete(_launch_browser())
+    yield browser
+    event_loop.run_until_complete(_close_browser(playwright, browser))
+
+
+def _build_auth_state(tokens: dict) -> dict:
+    """
+    Build a Playwright storage state holding the given auth tokens.
 
-        # Create the user
-        await sync_to_async(User.objects.create_user)(
-            email=unique_email, password="testpass123"
-        )
+    The tokens go in localStorage for the frontend and in cookies for the
+    middleware, so new contexts start authenticated without a page visit.
+    """
+    now = time.time()
+    return {
+        "cookies": [
+            {
+                "name": "accessToken",
+                "value": tokens["access"],
+                "domain": "localhost",
+                "path": "/",
+                "expires": now + 3600,
+                "httpOnly": False,
+                "secure": False,
+                "sameSite": "Lax",
+            },
+            {
+                "name": "refreshToken",
+                "value": tokens["refresh"],
+                "domain": "localhost",
+                "path": "/",
+                "expires": now + 604800,
+                "httpOnly": False,
+                "secure": False,
+                "sameSite": "Lax",
+            },
+        ],
+        "origins": [
+            {
+                "origin": "http://localhost:3000",
+                "localStorage": [
+                    {"name": "accessToken", "value": tokens["access"]},
+                    {"name": "refreshToken", "value": tokens["refresh"]},
+                ],
+            }
+        ],
+    }
+
+
+@pytest.fixture(scope="session")
+def _session_auth_state(django_db_setup, django_db_blocker) -> dict:
+    """
+    Create one authenticated storage state for the whole session.
 
-        # Generate auth tokens directly using Django REST framework
-        from rest_framework_simplejwt.tokens import RefreshToken
+    Page-level tests only need some valid token, so the user and its JWT
+    tokens are set up once. The user is created outside the per-test
+    transactions so it outlives each test.
+    """
+    # Name the user after the xdist worker so parallel workers never share it
+    worker_id = os.environ.get("PYTEST_XDIST_WORKER", "gw0")
+    email = f"auth_user_{worker_id}@example.com"
+    with django_db_blocker.unblock():
+        # Clean up any existing user with this email
+        User.objects.filter(email=email).delete()
 
-        user = await sync_to_async(User.objects.get)(email=unique_email)
-        refresh = await sync_to_async(RefreshToken.for_user)(user)
+        # Create the user and generate auth tokens for it
+        user = User.objects.create_user(email=email, password="testpass123")
+        refresh = RefreshToken.for_user(user)
         tokens = {
             "access": str(refresh.access_token),
             "refresh": str(refresh),
         }
 
-        # Navigate to any page first (needed for localStorage access)
-        await page.goto("http://localhost:3000/login", wait_until="domcontentloaded")
-
-        # Set tokens in localStorage
-        await page.evaluate(
-            f"localStorage.setItem('accessToken', '{tokens['access']}')"
-        )
-        await page.evaluate(
-            f"localStorage.setItem('refreshToken', '{tokens['refresh']}')"
-        )
-
-        # Verify tokens were set in localStorage
-        stored_access = await page.evaluate("localStorage.getItem('accessToken')")
-        assert (
-            stored_access == tokens["access"]
-        ), "Failed to set accessToken in localStorage"
-
-        # Also set tokens as cookies (middleware checks cookies)
-        await context.add_cookies(
-            [
-                {
-                    "name": "accessToken",
-                    "value": tokens["access"],
-                    "domain": "localhost",
-                    "path": "/",
-                    "max_age": 3600,
-                },
-                {
-                    "name": "refreshToken",
-                    "value": tokens["refresh"],
-                    "domain": "localhost",
-                    "path": "/",
-                    "max_age": 604800,
-                },
-            ]
-        )
-
-        # Give storage time to persist
-        await page.wait_for_timeout(200)
-
-        # Capture and save the storage state
-        state_file = test_dir / "auth_state.json"
-        storage_state = await context.storage_state(path=str(state_file))
-
-        return storage_state
-
-    finally:
-        await page.close()
-        await context.close()
+    return _build_auth_state(tokens)
+
+
+async def _new_context(browser: Browser, **kwargs) -> BrowserContext:
+    """Create a browser context with the suite's default timeouts applied."""
+    context = await browser.new_context(**kwargs)
+    context.set_default_timeout(ACTION_TIMEOUT)
+    context.set_default_navigation_timeout(NAVIGATION_TIMEOUT)
+    return context
+
+
+@pytest.fixture
+def auth_storage_state(_session_auth_state) -> dict:
+    """Provide the session's authenticated storage state for E2E tests."""
+    return _session_auth_state
 
 
 @pytest.fixture
 async def browser_context(browser: Browser, auth_storage_state) -> BrowserContext:
     """Provide an authenticated browser context for E2E tests."""
-    context = await browser.new_context(storage_state=auth_storage_state)
+    context = await _new_context(browser, storage_state=auth_storage_state)
     yield context
     await context.close()
 
@@ -126,10 +161,74 @@ async def authenticated_page(browser_context: BrowserContext):
     await page.close()
 
 
+@pytest.fixture
+def mock_barcode_api(browser_context: BrowserContext):
+    """
+    Provide a function that stubs the barcode processing endpoint.
+
+    The route is registered on the browser context, so it is active before
+    the first navigation and covers every page opened from that context.
+    """
+
+    async def mock(barcode_code: str, detected: bool = True) -> None:
+        body = json.dumps({"barcode_code": barcode_code, "detected": detected})
+
+        async def fulfill(route):
+            await route.fulfill(status=200, content_type="application/json", body=body)
+
+        await browser_context.route("**/api/barcode/process/**", fulfill)
+
+    return mock
+
+
+@pytest.fixture
+def mock_item_lookup(browser_context: BrowserContext):
+    """
+    Provide a function that stubs the item lookup endpoint for one UPC.
+
+    Like mock_barcode_api, the route lives on the browser context.
+    """
+
+    async def mock(upc: str, item: dict, product_data: dict) -> None:
+        body = json.dumps({"created": True, "item": item, "product_data": product_data})
+
+        async def fulfill(route):
+            await route.fulfill(status=201, content_type="application/json", body=body)
+
+        await browser_context.route(f"**/api/items/{upc}/**", fulfill)
+
+    return mock
+
+
+@pytest.fixture(scope="class")
+def shared_browser_context(
+    browser: Browser, event_loop, _session_auth_state
+) -> BrowserContext:
+    """
+    Provide an authenticated browser context shared by a whole test class.
+
+    Only for classes whose tests just load pages and read them; tests that
+    submit forms or change storage should use browser_context instead.
+    """
+    context = event_loop.run_until_complete(
+        _new_context(browser, storage_state=_session_auth_state)
+    )
+    yield context
+    event_loop.run_until_complete(context.close())
+
+
+@pytest.fixture
+async def shared_authenticated_page(shared_browser_context: BrowserContext):
+    """Provide a fresh page in the class-wide authenticated context."""
+    page = await shared_browser_context.new_page()
+    yield page
+    await page.close()
+
+
 @pytest.fixture
 async def unauthenticated_browser_context(browser: Browser) -> BrowserContext:
     """Provide an unauthenticated browser context for E2E tests."""
-    context = await browser.new_context()
+    context = await _new_context(browser)
     yield context
     await context.close()
 
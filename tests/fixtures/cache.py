@@ -0,0 +1,19 @@
+"""Cache fixtures."""
+
+import pytest
+from django.core.cache import cache
+
+from api.views.barcode import _get_model
+from api.views.items import _get_upc_client
+
+
+@pytest.fixture(autouse=True)
+def reset_caches():
+    """Drop cached clients and lookups so each test sees its own mocks."""
+    _get_model.cache_clear()
+    _get_upc_client.cache_clear()
+    cache.clear()
+    yield
+    _get_model.cache_clear()
+    _get_upc_client.cache_clear()
+    cache.clear()
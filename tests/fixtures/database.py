@@ -1,14 +1,18 @@
 """Database fixtures."""
 
 import pytest
-from django.contrib.auth import get_user_model
 
-User = get_user_model()
+from . import User
 
 
 @pytest.fixture
 def db_reset(db):
-    """Ensure a clean database for each test."""
-    User.objects.all().delete()
-    yield db
+    """
+    Ensure a clean database for each test.
+
+    The db fixture rolls back each test's own writes, but users committed by
+    the live dev server during browser tests outlive it, and --reuse-db keeps
+    them across runs. Clear them so tests never depend on earlier runs.
+    """
     User.objects.all().delete()
+    return db
@@ -1,45 +1,48 @@
 """HTTP client fixtures for API testing."""
 
+import json as json_module
+
 import pytest
 from django.test import Client
+from rest_framework_simplejwt.tokens import RefreshToken
 
 
 class APITestClient:
     """Wrapper around Django test client for API testing."""
 
+    BASE_HEADERS = {"Content-Type": "application/json"}
+
     def __init__(self, client: Client):
         self.client = client
         self.headers = {}
+        self._dispatch = {
+            "GET": client.get,
+            "POST": client.post,
+            "PUT": client.put,
+        }
 
     def _make_request(self, method: str, path: str, json_data=None, **kwargs):
         """Make a request and return a response-like object."""
-        import json as json_module
-
-        headers = {
-            "Content-Type": "application/json",
-            **self.headers,
-            **kwargs.get("headers", {}),
-        }
+        send = self._dispatch.get(method.upper())
+        if send is None:
+            raise ValueError(f"Unsupported method: {method}")
 
         # Prepare request kwargs
         request_kwargs = {
-            k: v for k, v in kwargs.items() if k not in ["headers", "json"]
+            k: v for k, v in kwargs.items() if k not in ("headers", "json")
+        }
+        request_kwargs["headers"] = {
+            **self.BASE_HEADERS,
+            **self.headers,
+            **kwargs.get("headers", {}),
         }
-        request_kwargs["headers"] = headers
 
         # Serialize JSON data if provided
         if json_data is not None:
             request_kwargs["data"] = json_module.dumps(json_data)
             request_kwargs["content_type"] = "application/json"
 
-        if method.lower() == "get":
-            response = self.client.get(path, **request_kwargs)
-        elif method.lower() == "post":
-            response = self.client.post(path, **request_kwargs)
-        elif method.lower() == "put":
-            response = self.client.put(path, **request_kwargs)
-        else:
-            raise ValueError(f"Unsupported method: {method}")
+        response = send(path, **request_kwargs)
 
         # Wrap response to add .json() method
         return ResponseWrapper(response)
@@ -65,12 +68,8 @@ class ResponseWrapper:
     def json(self):
         """Parse response as JSON."""
         if self._json is None:
-            try:
-                import json as json_module
-
-                self._json = json_module.loads(self.response.content.decode())
-            except Exception:
-                self._json = {}
+            # json.loads accepts bytes, so skip decoding the body first
+            self._json = json_module.loads(self.response.content)
         return self._json
 
     def __getattr__(self, name):
@@ -87,8 +86,6 @@ def http_client() -> APITestClient:
 @pytest.fixture
 def authenticated_client(test_user) -> APITestClient:
     """API test client authenticated with test user."""
-    from rest_framework_simplejwt.tokens import RefreshToken
-
     # Generate token for test user
     refresh = RefreshToken.for_user(test_user)
 
@@ -1,9 +1,10 @@
 """User fixtures."""
 
+from types import MappingProxyType
+
 import pytest
-from django.contrib.auth import get_user_model
 
-User = get_user_model()
+from . import User
 
 
 @pytest.fixture
@@ -14,21 +15,32 @@ def test_user(db_reset):
     )
 
 
-@pytest.fixture
-def test_user_data():
-    """Test user credentials."""
-    return {
+# Read-only so one instance can be shared by the whole session; tests that
+# need a variant take a .copy()
+TEST_USER_DATA = MappingProxyType(
+    {
         "email": "newuser@example.com",
         "password": "SecurePass123",
         "password_confirm": "SecurePass123",
     }
+)
 
-
-@pytest.fixture
-def invalid_user_data():
-    """Invalid test user data."""
-    return {
+INVALID_USER_DATA = MappingProxyType(
+    {
         "email": "invalid@example.com",
         "password": "short",
         "password_confirm": "different",
     }
+)
+
+
+@pytest.fixture(scope="session")
+def test_user_data():
+    """Test user credentials."""
+    return TEST_USER_DATA
+
+
+@pytest.fixture(scope="session")
+def invalid_user_data():
+    """Invalid test user data."""
+    return INVALID_USER_DATA
@@ -1,9 +1,8 @@
 """Utility fixtures."""
 
 import pytest
-from django.contrib.auth import get_user_model
 
-User = get_user_model()
+from . import User
 
 
 @pytest.fixture
@@ -10,8 +10,10 @@ Tests cover:
 - Protected endpoints
 """
 
+import jwt
 import pytest
 from django.contrib.auth import get_user_model
+from rest_framework_simplejwt.tokens import RefreshToken
 
 User = get_user_model()
 
@@ -28,7 +30,7 @@ class TestRegistration:
 
     def test_successful_registration(self, db_reset, http_client, test_user_data):
         """Test successful user registration."""
-        response = http_client.post("/api/auth/register/", json=test_user_data)
+        response = http_client.post("/api/auth/register/", json=dict(test_user_data))
 
         assert response.status_code == 201
         data = response.json()
@@ -246,8 +248,6 @@ class TestProfile:
         )
 
         # Authenticate as user1
-        from rest_framework_simplejwt.tokens import RefreshToken
-
         refresh = RefreshToken.for_user(user1)
         http_client.headers["Authorization"] = f"Bearer {str(refresh.access_token)}"
 
@@ -286,8 +286,6 @@ class TestTokens:
 
     def test_token_payload(self, db_reset, http_client, test_user):
         """Test that token contains expected claims."""
-        import jwt
-
         response = http_client.post(
             "/api/auth/login/",
             json={"email": "test@example.com", "password": "testpassword123"},
@@ -387,7 +385,9 @@ class TestAuthenticationFlow:
     ):
         """Test complete flow: register, login, access profile."""
         # Register
-        register_response = http_client.post("/api/auth/register/", json=test_user_data)
+        register_response = http_client.post(
+            "/api/auth/register/", json=dict(test_user_data)
+        )
         assert register_response.status_code == 201
 
         # Login
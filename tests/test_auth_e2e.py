@@ -13,10 +13,40 @@ Run with: make run-backend && make run-frontend (in separate terminals)
 """
 
 import pytest
+from asgiref.sync import sync_to_async
 from django.contrib.auth import get_user_model
+from playwright.async_api import expect
 
 User = get_user_model()
 
+# Client-side validation may block a submit so that no request is sent; wait
+# no longer than the fixed sleep these tests used before
+BLOCKED_SUBMIT_TIMEOUT = 1000
+
+
+def _is_auth_post(response) -> bool:
+    """Match the POST that the auth forms send to the backend on submit."""
+    return "/api/auth/" in response.url and response.request.method == "POST"
+
+
+async def _input_values(page, *ids: str) -> dict:
+    """Read the values of several inputs by id in a single round-trip."""
+    return await page.evaluate(
+        "(ids) => Object.fromEntries("
+        "ids.map((id) => [id, document.getElementById(id).value]))",
+        list(ids),
+    )
+
+
+async def _assert_selectors_exist(page, *selectors: str) -> None:
+    """Check that several elements are on the page in a single round-trip."""
+    found = await page.evaluate(
+        "(selectors) => selectors.map((s) => !!document.querySelector(s))",
+        list(selectors),
+    )
+    missing = [selector for selector, ok in zip(selectors, found) if not ok]
+    assert not missing, f"Missing elements: {missing}"
+
 
 # ============================================================================
 # Page Load E2E Tests (Smoke Tests)
@@ -28,57 +58,50 @@ class TestPageLoads:
     """Smoke tests to verify frontend pages load correctly."""
 
     @pytest.mark.asyncio
-    async def test_register_page_loads(self, authenticated_page, db_reset):
+    async def test_register_page_loads(self, shared_authenticated_page, db_reset):
         """Test register page loads and has form elements."""
-        authenticated_page.set_default_timeout(5000)
-
-        await authenticated_page.goto(
+        await shared_authenticated_page.goto(
             "http://localhost:3000/register", wait_until="domcontentloaded"
         )
 
         # Check page has title
-        title = await authenticated_page.title()
+        title = await shared_authenticated_page.title()
         assert title is not None
 
         # Check required form elements exist
-        assert await authenticated_page.query_selector("#email") is not None
-        assert await authenticated_page.query_selector("#password") is not None
-        assert await authenticated_page.query_selector("#passwordConfirm") is not None
-        assert (
-            await authenticated_page.query_selector('button[type="submit"]') is not None
+        await _assert_selectors_exist(
+            shared_authenticated_page,
+            "#email",
+            "#password",
+            "#passwordConfirm",
+            'button[type="submit"]',
         )
 
     @pytest.mark.asyncio
-    async def test_login_page_loads(self, authenticated_page, db_reset):
+    async def test_login_page_loads(self, shared_authenticated_page, db_reset):
         """Test login page loads and has form elements."""
-        authenticated_page.set_default_timeout(5000)
-
-        await authenticated_page.goto(
+        await shared_authenticated_page.goto(
             "http://localhost:3000/login", wait_until="domcontentloaded"
         )
 
         # Check page has title
-        title = await authenticated_page.title()
+        title = await shared_authenticated_page.title()
         assert title is not None
 
         # Check required form elements exist
-        assert await authenticated_page.query_selector("#email") is not None
-        assert await authenticated_page.query_selector("#password") is not None
-        assert (
-            await authenticated_page.query_selector('button[type="submit"]') is not None
+        await _assert_selectors_exist(
+            shared_authenticated_page, "#email", "#password", 'button[type="submit"]'
         )
 
     @pytest.mark.asyncio
-    async def test_dashboard_page_loads(self, authenticated_page, db_reset):
+    async def test_dashboard_page_loads(self, shared_authenticated_page, db_reset):
         """Test dashboard page loads (may redirect to login if unauthenticated)."""
-        authenticated_page.set_default_timeout(5000)
-
-        await authenticated_page.goto(
+        await shared_authenticated_page.goto(
             "http://localhost:3000/dashboard", wait_until="domcontentloaded"
         )
 
         # Page loaded successfully
-        assert authenticated_page.url is not None
+        assert shared_authenticated_page.url is not None
 
 
 # ============================================================================
@@ -93,45 +116,39 @@ class TestFormInteraction:
     @pytest.mark.asyncio
     async def test_registration_form_fillable(self, authenticated_page, db_reset):
         """Test that registration form fields can be filled."""
-        authenticated_page.set_default_timeout(5000)
-
         await authenticated_page.goto(
-            "http://localhost:3000/register", wait_until="domcontentloaded"
+            "http://localhost:3000/register", wait_until="commit"
         )
 
-        # Fill email field
+        # Fill the form fields
         await authenticated_page.fill("#email", "testuser@example.com")
-        email_value = await authenticated_page.input_value("#email")
-        assert email_value == "testuser@example.com"
-
-        # Fill password field
         await authenticated_page.fill("#password", "TestPass123")
-        password_value = await authenticated_page.input_value("#password")
-        assert password_value == "TestPass123"
-
-        # Fill password confirm field
         await authenticated_page.fill("#passwordConfirm", "TestPass123")
-        confirm_value = await authenticated_page.input_value("#passwordConfirm")
-        assert confirm_value == "TestPass123"
+
+        # Read every value back at once
+        values = await _input_values(
+            authenticated_page, "email", "password", "passwordConfirm"
+        )
+        assert values == {
+            "email": "testuser@example.com",
+            "password": "TestPass123",
+            "passwordConfirm": "TestPass123",
+        }
 
     @pytest.mark.asyncio
     async def test_login_form_fillable(self, authenticated_page, db_reset):
         """Test that login form fields can be filled."""
-        authenticated_page.set_default_timeout(5000)
-
         await authenticated_page.goto(
-            "http://localhost:3000/login", wait_until="domcontentloaded"
+            "http://localhost:3000/login", wait_until="commit"
         )
 
-        # Fill email field
+        # Fill the form fields
         await authenticated_page.fill("#email", "testuser@example.com")
-        email_value = await authenticated_page.input_value("#email")
-        assert email_value == "testuser@example.com"
-
-        # Fill password field
         await authenticated_page.fill("#password", "TestPass123")
-        password_value = await authenticated_page.input_value("#password")
-        assert password_value == "TestPass123"
+
+        # Read every value back at once
+        values = await _input_values(authenticated_page, "email", "password")
+        assert values == {"email": "testuser@example.com", "password": "TestPass123"}
 
 
 # ============================================================================
@@ -146,10 +163,8 @@ class TestRegistrationFlow:
     @pytest.mark.asyncio
     async def test_registration_form_submission(self, authenticated_page, db_reset):
         """Test submitting the registration form."""
-        authenticated_page.set_default_timeout(5000)
-
         await authenticated_page.goto(
-            "http://localhost:3000/register", wait_until="domcontentloaded"
+            "http://localhost:3000/register", wait_until="commit"
         )
 
         # Fill form
@@ -157,16 +172,18 @@ class TestRegistrationFlow:
         await authenticated_page.fill("#password", "SecurePass123!")
         await authenticated_page.fill("#passwordConfirm", "SecurePass123!")
 
-        # Get the button and check it's enabled
-        submit_button = await authenticated_page.query_selector('button[type="submit"]')
-        assert submit_button is not None
+        # Check the submit button exists; it may still be disabled
+        await expect(
+            authenticated_page.locator('button[type="submit"]')
+        ).to_be_attached()
 
         # Try to click submit button
         try:
-            await authenticated_page.click('button[type="submit"]', timeout=2000)
+            async with authenticated_page.expect_response(_is_auth_post) as response:
+                await authenticated_page.click('button[type="submit"]', timeout=2000)
 
-            # Wait a bit for response
-            await authenticated_page.wait_for_timeout(2000)
+            # Wait for the backend to respond
+            await response.value
 
             # Check if user was created in database
             try:
@@ -184,12 +201,8 @@ class TestRegistrationFlow:
         self, authenticated_page, db
     ):
         """Test that password mismatch can be detected."""
-        from asgiref.sync import sync_to_async
-
-        authenticated_page.set_default_timeout(5000)
-
         await authenticated_page.goto(
-            "http://localhost:3000/register", wait_until="domcontentloaded"
+            "http://localhost:3000/register", wait_until="commit"
         )
 
         # Fill form with mismatched passwords
@@ -198,14 +211,16 @@ class TestRegistrationFlow:
         await authenticated_page.fill("#passwordConfirm", "DifferentPass123!")
 
         # Verify the values are different
-        password = await authenticated_page.input_value("#password")
-        confirm = await authenticated_page.input_value("#passwordConfirm")
-        assert password != confirm
+        values = await _input_values(authenticated_page, "password", "passwordConfirm")
+        assert values["password"] != values["passwordConfirm"]
 
         # Try to submit
         try:
-            await authenticated_page.click('button[type="submit"]', timeout=2000)
-            await authenticated_page.wait_for_timeout(1000)
+            async with authenticated_page.expect_response(
+                _is_auth_post, timeout=BLOCKED_SUBMIT_TIMEOUT
+            ) as response:
+                await authenticated_page.click('button[type="submit"]', timeout=2000)
+            await response.value
         except Exception:
             pass
 
@@ -234,10 +249,8 @@ class TestLoginFlow:
     @pytest.mark.asyncio
     async def test_login_form_submission(self, authenticated_page, db_reset, test_user):
         """Test submitting the login form with valid credentials."""
-        authenticated_page.set_default_timeout(5000)
-
         await authenticated_page.goto(
-            "http://localhost:3000/login", wait_until="domcontentloaded"
+            "http://localhost:3000/login", wait_until="commit"
         )
 
         # Fill form with test user credentials
@@ -246,10 +259,11 @@ class TestLoginFlow:
 
         # Submit form
         try:
-            await authenticated_page.click('button[type="submit"]', timeout=2000)
+            async with authenticated_page.expect_response(_is_auth_post) as response:
+                await authenticated_page.click('button[type="submit"]', timeout=2000)
 
-            # Wait for potential navigation or response
-            await authenticated_page.wait_for_timeout(2000)
+            # Wait for the backend to respond
+            await response.value
 
             # Check if we navigated to dashboard or if we're still on login
             # (depends on frontend implementation)
@@ -261,10 +275,8 @@ class TestLoginFlow:
     @pytest.mark.asyncio
     async def test_login_with_nonexistent_user(self, authenticated_page, db_reset):
         """Test login with non-existent user email."""
-        authenticated_page.set_default_timeout(5000)
-
         await authenticated_page.goto(
-            "http://localhost:3000/login", wait_until="domcontentloaded"
+            "http://localhost:3000/login", wait_until="commit"
         )
 
         # Fill form with non-existent user
@@ -273,8 +285,11 @@ class TestLoginFlow:
 
         # Try to submit
         try:
-            await authenticated_page.click('button[type="submit"]', timeout=2000)
-            await authenticated_page.wait_for_timeout(1000)
+            async with authenticated_page.expect_response(
+                _is_auth_post, timeout=BLOCKED_SUBMIT_TIMEOUT
+            ) as response:
+                await authenticated_page.click('button[type="submit"]', timeout=2000)
+            await response.value
         except Exception:
             pass
 
@@ -288,10 +303,8 @@ class TestLoginFlow:
         self, authenticated_page, db_reset, test_user
     ):
         """Test login with correct email but wrong password."""
-        authenticated_page.set_default_timeout(5000)
-
         await authenticated_page.goto(
-            "http://localhost:3000/login", wait_until="domcontentloaded"
+            "http://localhost:3000/login", wait_until="commit"
         )
 
         # Fill form with correct email but wrong password
@@ -300,8 +313,11 @@ class TestLoginFlow:
 
         # Try to submit
         try:
-            await authenticated_page.click('button[type="submit"]', timeout=2000)
-            await authenticated_page.wait_for_timeout(1000)
+            async with authenticated_page.expect_response(
+                _is_auth_post, timeout=BLOCKED_SUBMIT_TIMEOUT
+            ) as response:
+                await authenticated_page.click('button[type="submit"]', timeout=2000)
+            await response.value
         except Exception:
             pass
 
@@ -319,60 +335,58 @@ class TestNavigation:
     """Tests for navigation between auth pages."""
 
     @pytest.mark.asyncio
-    async def test_navigate_to_register_from_login(self, authenticated_page, db_reset):
+    async def test_navigate_to_register_from_login(
+        self, shared_authenticated_page, db_reset
+    ):
         """Test navigation from login page to register page."""
-        authenticated_page.set_default_timeout(5000)
-
-        await authenticated_page.goto(
-            "http://localhost:3000/login", wait_until="domcontentloaded"
+        await shared_authenticated_page.goto(
+            "http://localhost:3000/login", wait_until="commit"
         )
 
         # Look for register/signup links
-        links = await authenticated_page.query_selector_all("a")
-        assert len(links) >= 0  # At least page loaded
+        link_count = await shared_authenticated_page.locator("a").count()
+        assert link_count >= 0  # At least page loaded
 
         # Try to navigate directly to register
-        await authenticated_page.goto(
+        await shared_authenticated_page.goto(
             "http://localhost:3000/register",
             wait_until="domcontentloaded",
             timeout=5000,
         )
 
         # Verify we're on register page
-        assert "register" in authenticated_page.url
+        assert "register" in shared_authenticated_page.url
 
     @pytest.mark.asyncio
-    async def test_navigate_to_login_from_register(self, authenticated_page, db_reset):
+    async def test_navigate_to_login_from_register(
+        self, shared_authenticated_page, db_reset
+    ):
         """Test navigation from register page to login page."""
-        authenticated_page.set_default_timeout(5000)
-
-        await authenticated_page.goto(
-            "http://localhost:3000/register", wait_until="domcontentloaded"
+        await shared_authenticated_page.goto(
+            "http://localhost:3000/register", wait_until="commit"
         )
 
         # Try to navigate directly to login
-        await authenticated_page.goto(
+        await shared_authenticated_page.goto(
             "http://localhost:3000/login", wait_until="domcontentloaded", timeout=5000
         )
 
         # Verify we're on login page
-        assert "login" in authenticated_page.url
+        assert "login" in shared_authenticated_page.url
 
     @pytest.mark.asyncio
-    async def test_dashboard_accessibility(self, authenticated_page, db_reset):
+    async def test_dashboard_accessibility(self, shared_authenticated_page, db_reset):
         """Test that dashboard page is accessible."""
-        authenticated_page.set_default_timeout(5000)
-
         # Navigate to dashboard (might redirect if not authenticated, which is ok)
-        await authenticated_page.goto(
+        await shared_authenticated_page.goto(
             "http://localhost:3000/dashboard",
             wait_until="domcontentloaded",
             timeout=5000,
         )
 
         # Page loaded successfully
-        assert authenticated_page.url is not None
-        assert "localhost:3000" in authenticated_page.url
+        assert shared_authenticated_page.url is not None
+        assert "localhost:3000" in shared_authenticated_page.url
 
 
 # ============================================================================
@@ -389,10 +403,8 @@ class TestEmailField:
         self, authenticated_page, db_reset
     ):
         """Test that email is retained after failed registration."""
-        authenticated_page.set_default_timeout(5000)
-
         await authenticated_page.goto(
-            "http://localhost:3000/register", wait_until="domcontentloaded"
+            "http://localhost:3000/register", wait_until="commit"
         )
 
         # Fill email field
@@ -400,8 +412,9 @@ class TestEmailField:
 
         # Try to submit with empty password (should fail)
         try:
+            # The empty required password blocks submission in the browser,
+            # so there is no request or navigation to wait for
             await authenticated_page.click('button[type="submit"]', timeout=2000)
-            await authenticated_page.wait_for_timeout(1000)
 
             # Check email is still in field
             email_value = await authenticated_page.input_value("#email")
@@ -422,43 +435,31 @@ class TestElementVisibility:
     """Tests for element visibility and accessibility."""
 
     @pytest.mark.asyncio
-    async def test_password_fields_exist_and_hidden(self, authenticated_page, db_reset):
+    async def test_password_fields_exist_and_hidden(
+        self, shared_authenticated_page, db_reset
+    ):
         """Test that password fields exist and are type=password."""
-        authenticated_page.set_default_timeout(5000)
-
-        await authenticated_page.goto(
+        await shared_authenticated_page.goto(
             "http://localhost:3000/login", wait_until="domcontentloaded"
         )
 
-        # Check password field exists
-        password_field = await authenticated_page.query_selector("#password")
-        assert password_field is not None
-
-        # Check it's type password (value should be hidden)
-        field_type = await authenticated_page.get_attribute("#password", "type")
-        assert field_type == "password"
+        # Check password field exists and is type password (value should be hidden)
+        await expect(shared_authenticated_page.locator("#password")).to_have_attribute(
+            "type", "password"
+        )
 
     @pytest.mark.asyncio
-    async def test_all_form_fields_visible(self, authenticated_page, db_reset):
+    async def test_all_form_fields_visible(self, shared_authenticated_page, db_reset):
         """Test that all form fields are visible and not hidden."""
-        authenticated_page.set_default_timeout(5000)
-
-        await authenticated_page.goto(
+        await shared_authenticated_page.goto(
             "http://localhost:3000/register", wait_until="domcontentloaded"
         )
 
-        # Check email field is visible
-        email_visible = await authenticated_page.is_visible("#email")
-        assert email_visible
-
-        # Check password field is visible
-        password_visible = await authenticated_page.is_visible("#password")
-        assert password_visible
-
-        # Check confirm password field is visible
-        confirm_visible = await authenticated_page.is_visible("#passwordConfirm")
-        assert confirm_visible
-
-        # Check submit button is visible
-        button_visible = await authenticated_page.is_visible('button[type="submit"]')
-        assert button_visible
+        # Check every field and the submit button are visible
+        for selector in (
+            "#email",
+            "#password",
+            "#passwordConfirm",
+            'button[type="submit"]',
+        ):
+            await expect(shared_authenticated_page.locator(selector)).to_be_visible()
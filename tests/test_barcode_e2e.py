@@ -16,17 +16,64 @@ Run with: make run-backend && make run-frontend (in separate terminals)
 
 import base64
 import io
-import json
+import re
 from unittest.mock import MagicMock, patch
 
 import pytest
-from asgiref.sync import sync_to_async
-from django.contrib.auth import get_user_model
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
 from PIL import Image
+from playwright.async_api import expect
 
 pytestmark = pytest.mark.e2e
 
-User = get_user_model()
+
+def _create_test_image(color: str = "red", size: tuple = (8, 8)) -> str:
+    """Create a solid-colour JPEG test image and return it as base64."""
+    img = Image.new("RGB", size, color=color)
+    img_bytes = io.BytesIO()
+    img.save(img_bytes, format="JPEG")
+    return base64.b64encode(img_bytes.getvalue()).decode("utf-8")
+
+
+# Encoded once at import; tests only ever read it. Gemini is always mocked,
+# so a tiny image is enough and keeps request bodies small
+TEST_IMAGE_BASE64 = _create_test_image()
+
+
+async def _goto_barcode(page) -> None:
+    """Open the barcode page and wait for its header rather than network idle."""
+    await page.goto("http://localhost:3000/barcode", wait_until="domcontentloaded")
+    await page.wait_for_selector("h1", state="visible")
+
+
+@pytest.fixture
+async def barcode_page(authenticated_page):
+    """Provide an authenticated page already open on the barcode page."""
+    await _goto_barcode(authenticated_page)
+    return authenticated_page
+
+
+@pytest.fixture
+async def shared_barcode_page(shared_authenticated_page):
+    """Provide the class-wide authenticated page open on the barcode page."""
+    await _goto_barcode(shared_authenticated_page)
+    return shared_authenticated_page
+
+
+async def _submit_barcode_image(page, image_base64: str) -> dict:
+    """POST an image to the barcode endpoint from inside the page."""
+    return await page.evaluate(
+        """async (image) => {
+            const response = await fetch("/api/barcode/process/", {
+                method: "POST",
+                headers: { "Content-Type": "application/json" },
+                body: JSON.stringify({ image }),
+            });
+            return await response.json();
+        }""",
+        image_base64,
+    )
 
 
 class TestBarcodePageAuth:
@@ -40,13 +87,13 @@ class TestBarcodePageAuth:
         # Try to access barcode page without token
         await unauthenticated_page.goto(
             "http://localhost:3000/barcode",
-            wait_until="networkidle",
+            wait_until="domcontentloaded",
         )
 
         # Wait for redirect to happen (useEffect runs after domcontentloaded)
         try:
             await unauthenticated_page.wait_for_url(
-                "http://localhost:3000/login*", timeout=3000
+                "http://localhost:3000/login*", wait_until="commit", timeout=3000
             )
         except Exception:
             # If redirect doesn't happen, check current URL
@@ -56,73 +103,45 @@ class TestBarcodePageAuth:
         assert "login" in unauthenticated_page.url
 
     @pytest.mark.asyncio
-    async def test_barcode_page_accessible_when_authenticated(
-        self, authenticated_page, db
-    ):
+    async def test_barcode_page_accessible_when_authenticated(self, barcode_page, db):
         """Test that authenticated users can access barcode page."""
-        # Navigate directly to barcode page - should succeed with authenticated context
-        await authenticated_page.goto(
-            "http://localhost:3000/barcode", wait_until="networkidle"
-        )
-
         # Should stay on barcode page (not redirected to login)
-        assert "/barcode" in authenticated_page.url
+        assert "/barcode" in barcode_page.url
 
 
 class TestBarcodePageUI:
     """Test barcode page UI elements and layout."""
 
     @pytest.mark.asyncio
-    async def test_barcode_page_has_required_elements(self, authenticated_page, db):
-        """Test that barcode page has all required UI elements."""
-        # Navigate to barcode page with authenticated context
-        await authenticated_page.goto(
-            "http://localhost:3000/barcode", wait_until="networkidle"
-        )
-
+    async def test_barcode_page_has_required_elements(self, shared_barcode_page):
+        """Test that barcode page has its header, description, and buttons."""
         # Check for page title
-        title = await authenticated_page.title()
+        title = await shared_barcode_page.title()
         assert title is not None
 
         # Check for header
-        header = await authenticated_page.query_selector("h1")
-        assert header is not None
-        header_text = await header.text_content()
-        assert "Barcode Scanner" in header_text
+        await expect(shared_barcode_page.locator("h1").first).to_contain_text(
+            "Barcode Scanner"
+        )
 
         # Check for description
-        description = await authenticated_page.query_selector("p")
-        assert description is not None
-
-        # Check for buttons - should have Enable Camera button before camera is initialized
-        buttons = await authenticated_page.query_selector_all("button")
-        assert len(buttons) > 0
-        button_texts = [await btn.text_content() for btn in buttons]
-
-        # Should have Enable Camera or Capture buttons, and Confirm
-        button_names = " ".join(button_texts)
-        assert "Enable Camera" in button_names or "Confirm" in button_names
+        await expect(shared_barcode_page.locator("p").first).to_contain_text(
+            re.compile("camera|barcode", re.IGNORECASE)
+        )
 
-    @pytest.mark.asyncio
-    async def test_barcode_page_has_navigation_buttons(self, authenticated_page, db):
-        """Test that barcode page has navigation buttons."""
-        # Navigate to barcode page with authenticated context
-        await authenticated_page.goto(
-            "http://localhost:3000/barcode", wait_until="networkidle"
+        # Check if page mentions camera access or detection method
+        camera_text = shared_barcode_page.get_by_text(
+            re.compile("camera|detection|capture", re.IGNORECASE)
         )
+        await expect(camera_text.first).to_be_attached()
 
         # Check for buttons - should have at least Enable Camera and Confirm
-        buttons = await authenticated_page.query_selector_all("button")
-        # At least Enable Camera and Confirm buttons initially
-        assert len(buttons) >= 2
-
-        # Check button text contains expected actions
-        button_texts = []
-        for btn in buttons:
-            text = await btn.text_content()
-            button_texts.append(text)
+        button_texts = await shared_barcode_page.locator("button").all_text_contents()
+        assert len(button_texts) >= 2
 
-        # Should have either "Enable Camera" initially or "Capture" after enabling
+        # Should have Enable Camera or Capture buttons, and Confirm
+        button_names = " ".join(button_texts)
+        assert "Enable Camera" in button_names or "Confirm" in button_names
         assert any(
             "Enable Camera" in text
             or "Capture" in text
@@ -132,229 +151,111 @@ class TestBarcodePageUI:
         )
 
 
-class TestBarcodeInitialization:
-    """Test barcode scanner initialization."""
-
-    @pytest.mark.asyncio
-    async def test_barcode_page_initializes_camera(self, authenticated_page, db):
-        """Test that barcode page attempts to initialize camera."""
-        # Navigate to barcode page with authenticated context
-        await authenticated_page.goto(
-            "http://localhost:3000/barcode", wait_until="networkidle"
-        )
-
-        # Check if page mentions camera access or detection method
-        page_content = await authenticated_page.content()
-        assert (
-            "camera" in page_content.lower()
-            or "detection" in page_content.lower()
-            or "capture" in page_content.lower()
-        )
-
-
 class TestBarcodeCapture:
     """Test barcode capture functionality."""
 
     @pytest.mark.asyncio
-    async def test_capture_button_exists_and_clickable(self, authenticated_page, db):
+    async def test_capture_button_exists_and_clickable(self, barcode_page, db):
         """Test that capture button exists and becomes clickable."""
-        # Navigate to barcode page with authenticated context
-        await authenticated_page.goto(
-            "http://localhost:3000/barcode", wait_until="networkidle"
-        )
-
         # Click "Enable Camera" button to initialize the camera
-        enable_camera_button = await authenticated_page.query_selector(
-            "button:has-text('Enable Camera')"
-        )
-        if enable_camera_button:
-            await enable_camera_button.click()
-
-        # Wait for camera to initialize and buttons to appear
-        try:
-            await authenticated_page.wait_for_selector("button", timeout=3000)
-        except Exception:
-            pass
+        enable_camera_button = barcode_page.locator("button", has_text="Enable Camera")
+        if await enable_camera_button.count() > 0:
+            await enable_camera_button.first.click()
 
         # Look for capture button - it might be disabled initially
-        buttons = await authenticated_page.query_selector_all("button")
-        capture_button = None
-        for btn in buttons:
-            text = await btn.text_content()
-            if text and ("Capture" in text or "Processing" in text):
-                capture_button = btn
-                break
-
-        assert capture_button is not None
-
-    @pytest.mark.asyncio
-    async def test_cancel_button_navigates_to_dashboard(self, authenticated_page, db):
-        """Test that cancel button navigates back to dashboard."""
-        # Create and login test user
-        await sync_to_async(User.objects.create_user)(
-            email="barcode_cancel@example.com", password="testpass123"
+        capture_button = barcode_page.locator(
+            "button", has_text=re.compile("Capture|Processing")
         )
 
-        # Login
-        await authenticated_page.goto("http://localhost:3000/login")
-        await authenticated_page.fill("#email", "barcode_cancel@example.com")
-        await authenticated_page.fill("#password", "testpass123")
-        await authenticated_page.click('button[type="submit"]')
+        # Wait for camera to initialize and the capture button to appear
         try:
-            await authenticated_page.wait_for_url(
-                "http://localhost:3000/dashboard*", timeout=3000
-            )
+            await capture_button.first.wait_for(timeout=3000)
         except Exception:
             pass
 
-        # Navigate to barcode page
-        await authenticated_page.goto(
-            "http://localhost:3000/barcode",
-            wait_until="networkidle",
-        )
+        assert await capture_button.count() > 0
 
-        # Wait for buttons to appear
+    @pytest.mark.asyncio
+    async def test_cancel_button_navigates_to_dashboard(self, barcode_page, db):
+        """Test that cancel button navigates back to dashboard."""
+        # Wait for the cancel button to appear
+        cancel_button = barcode_page.locator("button", has_text="Cancel")
         try:
-            await authenticated_page.wait_for_selector(
-                "button:has-text('Cancel')", timeout=2000
-            )
+            await cancel_button.first.wait_for(timeout=2000)
         except Exception:
-            # If selector fails, try finding by text content
             pass
 
         # Click cancel button
-        buttons = await authenticated_page.query_selector_all("button")
-        cancel_button = None
-        for btn in buttons:
-            text = await btn.text_content()
-            if text and "Cancel" in text:
-                cancel_button = btn
-                break
-
-        if cancel_button:
-            await cancel_button.click()
+        if await cancel_button.count() > 0:
+            await cancel_button.first.click()
             try:
-                await authenticated_page.wait_for_url(
-                    "http://localhost:3000/dashboard*", timeout=2000
+                await barcode_page.wait_for_url(
+                    "http://localhost:3000/dashboard*",
+                    wait_until="commit",
+                    timeout=2000,
                 )
             except Exception:
                 pass
             # Should be on dashboard or login
-            assert (
-                "dashboard" in authenticated_page.url
-                or "login" in authenticated_page.url
-            )
+            assert "dashboard" in barcode_page.url or "login" in barcode_page.url
 
 
 class TestBarcodeUiFeedback:
     """Test UI feedback during barcode capture and processing."""
 
-    @staticmethod
-    def _create_test_image() -> str:
-        """Create a simple test image and return as base64."""
-        img = Image.new("RGB", (100, 100), color="red")
-        img_bytes = io.BytesIO()
-        img.save(img_bytes, format="JPEG")
-        img_bytes.seek(0)
-        return base64.b64encode(img_bytes.getvalue()).decode("utf-8")
-
     @pytest.mark.asyncio
-    async def test_fadeout_animation_is_injected_into_page(self, authenticated_page):
-        """Test that fadeOut animation CSS is injected into the page."""
-        # Navigate to barcode page
-        await authenticated_page.goto(
-            "http://localhost:3000/barcode", wait_until="networkidle"
+    async def test_barcode_page_static_contract(self, shared_barcode_page):
+        """Test that the page ships its flash animation and camera view."""
+        # Page should still be on barcode route after initialization
+        assert (
+            "/barcode" in shared_barcode_page.url
+        ), "Should remain on barcode page after initialization"
+
+        # Content should include main UI elements
+        barcode_text = shared_barcode_page.get_by_text(
+            re.compile("barcode", re.IGNORECASE)
         )
+        await expect(barcode_text.first).to_be_attached()
 
-        # Check that fadeOut animation is defined in page styles
-        page_content = await authenticated_page.content()
+        # Check that fadeOut animation is defined in page styles. Only the
+        # <style> tags are read; text locators skip them.
+        styles = await shared_barcode_page.locator("style").evaluate_all(
+            "elements => elements.map((el) => el.textContent).join('\\n')"
+        )
 
         # Verify animation definition exists
         assert (
-            "@keyframes fadeOut" in page_content
-            or "@keyframes fadeout" in page_content.lower()
+            "@keyframes fadeOut" in styles or "@keyframes fadeout" in styles.lower()
         ), "fadeOut animation should be defined in page CSS"
 
         # Verify it has the correct opacity values
         assert (
-            "opacity: 0.4" in page_content and "opacity: 0" in page_content
+            "opacity: 0.4" in styles and "opacity: 0" in styles
         ), "Animation should fade from 0.4 to 0 opacity"
 
-    @pytest.mark.asyncio
-    async def test_processing_overlay_component_renders(self, authenticated_page):
-        """Test that ProcessingOverlay component is imported and available."""
-        # Navigate to barcode page
-        await authenticated_page.goto(
-            "http://localhost:3000/barcode", wait_until="networkidle"
-        )
-
-        # Verify we're on the barcode page
-        assert "/barcode" in authenticated_page.url, "Should be on barcode page"
-
-        # Verify barcode scanner content loads
-        page_content = await authenticated_page.content()
-        assert (
-            "Barcode Scanner" in page_content or "barcode" in page_content.lower()
-        ), "Page should display barcode scanner content"
-
-    @pytest.mark.asyncio
-    async def test_camera_view_has_flash_overlay_placeholder(self, authenticated_page):
-        """Test that camera view is set up with flash effect capability."""
-        # Navigate to barcode page
-        await authenticated_page.goto(
-            "http://localhost:3000/barcode", wait_until="networkidle"
-        )
-
         # Verify Enable Camera button is present (camera not yet initialized)
-        enable_button = await authenticated_page.query_selector("button")
-        assert enable_button is not None, "Page should have buttons"
+        await expect(shared_barcode_page.locator("button").first).to_be_attached()
 
         # Verify camera view structure is set up
         # The CameraView component should be rendered with proper classes
-        page_content = await authenticated_page.content()
-        assert (
-            "space-y-4" in page_content or "camera" in page_content.lower()
-        ), "Page should have camera view component"
-
-    @pytest.mark.asyncio
-    async def test_barcode_scanner_state_initializes(self, authenticated_page):
-        """Test that barcode scanner initializes without errors."""
-        # Navigate to barcode page
-        await authenticated_page.goto(
-            "http://localhost:3000/barcode", wait_until="networkidle"
+        camera_view = shared_barcode_page.locator(".space-y-4").or_(
+            shared_barcode_page.get_by_text(re.compile("camera", re.IGNORECASE))
         )
-
-        # Page should still be on barcode route after initialization
-        assert (
-            "/barcode" in authenticated_page.url
-        ), "Should remain on barcode page after initialization"
-
-        # Content should include main UI elements
-        page_content = await authenticated_page.content()
-        assert (
-            "Barcode Scanner" in page_content or "barcode" in page_content.lower()
-        ), "Page should display barcode scanner title or content"
+        await expect(camera_view.first).to_be_attached()
 
 
 class TestBarcodeErrorHandling:
     """Test error handling in barcode scanner."""
 
     @pytest.mark.asyncio
-    async def test_barcode_page_handles_missing_container(self, authenticated_page, db):
+    async def test_barcode_page_handles_missing_container(self, shared_barcode_page):
         """Test that barcode page handles initialization gracefully."""
-        # Navigate to barcode page with authenticated context
-        await authenticated_page.goto(
-            "http://localhost:3000/barcode", wait_until="networkidle"
-        )
-
         # Check that page didn't crash (still on barcode page)
-        assert "/barcode" in authenticated_page.url
+        assert "/barcode" in shared_barcode_page.url
 
         # Check that page has button to enable camera
-        enable_button = await authenticated_page.query_selector(
-            "button:has-text('Enable Camera')"
-        )
-        assert enable_button is not None, "Enable Camera button should be present"
+        enable_button = shared_barcode_page.locator("button", has_text="Enable Camera")
+        await expect(enable_button.first).to_be_attached()
 
 
 class TestBarcodeImageSubmissionFlow:
@@ -362,238 +263,125 @@ class TestBarcodeImageSubmissionFlow:
 
     @pytest.mark.asyncio
     async def test_image_submission_displays_barcode_result(
-        self, authenticated_page, authenticated_client
+        self, authenticated_page, authenticated_client, mock_barcode_api
     ):
         """Test that submitting an image displays the barcode result on the page."""
-        # Step 1: Navigate to barcode page with authenticated context
-        await authenticated_page.goto(
-            "http://localhost:3000/barcode", wait_until="networkidle"
-        )
-
-        # Step 2: Create a simple test image and submit it via the API
-        test_image_base64 = self._create_test_image()
+        # Step 1: Mock the barcode processing API
         mock_barcode_code = "012345678901"
+        await mock_barcode_api(mock_barcode_code)
 
-        # Mock the barcode processing API
-        async def handle_barcode_api(route):
-            await route.fulfill(
-                status=200,
-                content_type="application/json",
-                body=json.dumps(
-                    {
-                        "barcode_code": mock_barcode_code,
-                        "detected": True,
-                    }
-                ),
-            )
-
-        await authenticated_page.route("**/api/barcode/process/**", handle_barcode_api)
-
-        # Step 3: Simulate the barcode processing by calling the API and updating page content
-        # Use page.evaluate to trigger the frontend's state update
-        result = await authenticated_page.evaluate(
-            f"""
-        (async function() {{
-            const imageData = '{test_image_base64}';
-            const response = await fetch('/api/barcode/process/', {{
-                method: 'POST',
-                headers: {{
-                    'Content-Type': 'application/json'
-                }},
-                body: JSON.stringify({{ image: imageData }})
-            }});
-            return await response.json();
-        }})()
-        """
-        )
+        # Step 2: Navigate to barcode page with authenticated context
+        await _goto_barcode(authenticated_page)
 
-        # Step 4: Wait for any DOM updates
-        await authenticated_page.wait_for_timeout(2000)
+        # Step 3: Simulate the barcode processing by calling the API from the page
+        result = await _submit_barcode_image(authenticated_page, TEST_IMAGE_BASE64)
 
-        # Step 5: Verify the barcode result could be displayed
+        # Step 4: Verify the barcode result could be displayed
         # Since we can't easily update React state from the test, just verify the API works
         assert result["detected"] is True
         assert result["barcode_code"] == mock_barcode_code
 
-    @staticmethod
-    def _create_test_image() -> str:
-        """Create a simple test image and return as base64."""
-        img = Image.new("RGB", (100, 100), color="red")
-        img_bytes = io.BytesIO()
-        img.save(img_bytes, format="JPEG")
-        img_bytes.seek(0)
-        return base64.b64encode(img_bytes.getvalue()).decode("utf-8")
-
     @pytest.mark.asyncio
     async def test_undetected_barcode_shows_error(
-        self, authenticated_page, authenticated_client
+        self, authenticated_page, authenticated_client, mock_barcode_api
     ):
         """Test that when Gemini cannot detect a barcode, an error is shown."""
         # Step 1: Grant camera permission to the page
         await authenticated_page.context.grant_permissions(["camera"])
 
-        # Step 2: Navigate to barcode page with authenticated context
-        await authenticated_page.goto(
-            "http://localhost:3000/barcode", wait_until="networkidle"
-        )
+        # Step 2: Mock the barcode API to return "not detected"
+        await mock_barcode_api("UNABLE_TO_READ", detected=False)
 
-        # Step 3: Mock the barcode API to return "not detected"
-        async def handle_undetected_barcode(route):
-            """Mock barcode processing that cannot detect a barcode."""
-            await route.fulfill(
-                status=200,
-                content_type="application/json",
-                body=json.dumps(
-                    {
-                        "barcode_code": "UNABLE_TO_READ",
-                        "detected": False,
-                    }
-                ),
-            )
+        # Step 3: Navigate to barcode page with authenticated context
+        await _goto_barcode(authenticated_page)
 
-        # Set up route interception
-        await authenticated_page.route(
-            "**/api/barcode/process/**",
-            handle_undetected_barcode,
+        # Step 4: Wait for the camera permissions or capture button to appear
+        request_camera_button = authenticated_page.locator(
+            "button", has_text="Request Camera Permissions"
         )
-
-        # Step 4: Wait for buttons to appear
+        capture_button = authenticated_page.locator("button", has_text="Capture")
         try:
-            await authenticated_page.wait_for_selector("button", timeout=3000)
+            await request_camera_button.or_(capture_button).first.wait_for(timeout=3000)
         except Exception:
             pass
 
-        # Step 5: Find the camera permissions and capture buttons
-        buttons = await authenticated_page.query_selector_all("button")
-        request_camera_button = None
-        capture_button = None
-
-        for btn in buttons:
-            text = await btn.text_content()
-            if text and "Request Camera Permissions" in text:
-                request_camera_button = btn
-            if text and "Capture" in text:
-                capture_button = btn
+        # Step 5: Check which of the two buttons the page is showing
+        has_request_camera_button = await request_camera_button.count() > 0
+        has_capture_button = await capture_button.count() > 0
 
         # Step 6: Click the "Request Camera Permissions" button to initialize camera
-        if request_camera_button:
-            await request_camera_button.click()
-            # Wait for camera to initialize
-            await authenticated_page.wait_for_timeout(2000)
-
-        # Step 7: Click the capture button to trigger the API call
-        if capture_button:
-            await capture_button.click()
-            # Wait for response
-            await authenticated_page.wait_for_timeout(2000)
-
-        # Step 8: Verify error message is shown
-        page_content = await authenticated_page.content()
-        assert (
-            "Could not read the barcode" in page_content
-            or "error" in page_content.lower()
-            or "UNABLE_TO_READ" in page_content
-        ), "Error message not found when barcode detection fails"
+        if has_request_camera_button:
+            await request_camera_button.first.click()
+
+        # Step 7: Click the capture button to trigger the API call. The click
+        # waits for the button to become enabled once the camera is ready.
+        if has_capture_button:
+            try:
+                async with authenticated_page.expect_response(
+                    "**/api/barcode/process/**", timeout=5000
+                ):
+                    await capture_button.first.click(timeout=5000)
+            except Exception:
+                # The capture may not produce a matching response; the error
+                # text check below still decides the test
+                pass
+
+        # Step 8: Verify error message is shown once the error state renders
+        error_text = authenticated_page.get_by_text(
+            re.compile("Could not read the barcode|error|UNABLE_TO_READ", re.IGNORECASE)
+        )
+        await expect(error_text.first).to_be_attached()
 
     @pytest.mark.asyncio
     async def test_manual_capture_displays_barcode_result(
-        self, authenticated_page, authenticated_client
+        self,
+        authenticated_page,
+        authenticated_client,
+        mock_barcode_api,
+        mock_item_lookup,
     ):
         """Test that manual image capture displays barcode result and product lookup is triggered."""
-        # Step 1: Navigate to barcode page
-        await authenticated_page.goto(
-            "http://localhost:3000/barcode", wait_until="networkidle"
-        )
-
-        # Step 2: Test barcode API directly
+        # Step 1: Mock barcode API and item lookup responses
         mock_barcode_code = "5901234123457"
-        test_image_base64 = self._create_test_image()
-
-        # Mock barcode API response
-        async def handle_barcode_api(route):
-            await route.fulfill(
-                status=200,
-                content_type="application/json",
-                body=json.dumps(
-                    {
-                        "barcode_code": mock_barcode_code,
-                        "detected": True,
-                    }
-                ),
-            )
-
-        await authenticated_page.route("**/api/barcode/process/**", handle_barcode_api)
-
-        # Mock item lookup response with product details
-        async def handle_item_lookup(route):
-            await route.fulfill(
-                status=201,
-                content_type="application/json",
-                body=json.dumps(
-                    {
-                        "created": True,
-                        "item": {
-                            "id": 1,
-                            "barcode": mock_barcode_code,
-                            "title": "Premium Organic Coffee Beans",
-                            "description": "High-quality arabica coffee beans from Ethiopia",
-                            "alias": "Coffee",
-                            "brand": 1,
-                        },
-                        "product_data": {
-                            "barcode": mock_barcode_code,
-                            "title": "Premium Organic Coffee Beans",
-                            "brand": "Mountain Peak",
-                            "category": "Food & Beverages",
-                            "size": "1 kg",
-                            "quantity": "1",
-                            "description": "High-quality arabica coffee beans from Ethiopia",
-                        },
-                    }
-                ),
-            )
-
-        await authenticated_page.route(
-            f"**/api/items/{mock_barcode_code}/**", handle_item_lookup
+        await mock_barcode_api(mock_barcode_code)
+        await mock_item_lookup(
+            mock_barcode_code,
+            item={
+                "id": 1,
+                "barcode": mock_barcode_code,
+                "title": "Premium Organic Coffee Beans",
+                "description": "High-quality arabica coffee beans from Ethiopia",
+                "alias": "Coffee",
+                "brand": 1,
+            },
+            product_data={
+                "barcode": mock_barcode_code,
+                "title": "Premium Organic Coffee Beans",
+                "brand": "Mountain Peak",
+                "category": "Food & Beverages",
+                "size": "1 kg",
+                "quantity": "1",
+                "description": "High-quality arabica coffee beans from Ethiopia",
+            },
         )
 
+        # Step 2: Navigate to barcode page
+        await _goto_barcode(authenticated_page)
+
         # Step 3: Call the barcode API directly
-        result = await authenticated_page.evaluate(
-            f"""
-        (async function() {{
-            const imageData = '{test_image_base64}';
-            const response = await fetch('/api/barcode/process/', {{
-                method: 'POST',
-                headers: {{
-                    'Content-Type': 'application/json'
-                }},
-                body: JSON.stringify({{ image: imageData }})
-            }});
-            return await response.json();
-        }})()
-        """
-        )
+        result = await _submit_barcode_image(authenticated_page, TEST_IMAGE_BASE64)
 
         # Step 4: Verify barcode was detected
         assert result["detected"] is True
         assert result["barcode_code"] == mock_barcode_code
 
-        # Step 5: Verify API responses work
-        await authenticated_page.wait_for_timeout(500)
-
-        # Test that item lookup API also works
+        # Step 5: Test that item lookup API also works
         item_response = await authenticated_page.evaluate(
-            f"""
-        (async function() {{
-            const response = await fetch('/api/items/{mock_barcode_code}/', {{
-                method: 'GET',
-                headers: {{
-                    'Content-Type': 'application/json'
-                }}
-            }});
-            return {{status: response.status, ok: response.ok}};
-        }})()
-        """
+            """async (upc) => {
+                const response = await fetch(`/api/items/${upc}/`);
+                return { status: response.status, ok: response.ok };
+            }""",
+            mock_barcode_code,
         )
 
         # Item lookup should return 201 (mocked)
@@ -601,65 +389,44 @@ class TestBarcodeImageSubmissionFlow:
 
     @pytest.mark.asyncio
     async def test_auto_detection_triggers_product_lookup(
-        self, authenticated_page, authenticated_client
+        self, authenticated_page, authenticated_client, mock_item_lookup
     ):
         """Test that auto-detected barcode would trigger product lookup."""
         # Step 1: Grant camera permission
         await authenticated_page.context.grant_permissions(["camera"])
 
-        # Step 2: Navigate to barcode page
-        await authenticated_page.goto(
-            "http://localhost:3000/barcode", wait_until="networkidle"
-        )
-
-        # Step 3: Set up mock for item lookup (this is called after auto-detection)
+        # Step 2: Set up mock for item lookup (this is called after auto-detection)
         mock_barcode_code = "4006381333931"
-
-        item_lookup_called = False
-
-        async def handle_item_lookup(route):
-            """Mock item lookup API for auto-detected barcode."""
-            nonlocal item_lookup_called
-            item_lookup_called = True
-            await route.fulfill(
-                status=201,
-                content_type="application/json",
-                body=json.dumps(
-                    {
-                        "created": True,
-                        "item": {
-                            "id": 2,
-                            "barcode": mock_barcode_code,
-                            "title": "Braun Electric Shaver Series 9",
-                            "description": "Professional electric shaver with precision technology",
-                            "alias": "Shaver",
-                            "brand": 2,
-                        },
-                        "product_data": {
-                            "barcode": mock_barcode_code,
-                            "title": "Braun Electric Shaver Series 9",
-                            "brand": "Braun",
-                            "category": "Personal Care",
-                            "size": "Standard",
-                            "quantity": "1",
-                            "description": "Professional electric shaver with precision technology",
-                        },
-                    }
-                ),
-            )
-
-        # Register the item lookup route
-        await authenticated_page.route(
-            f"**/api/items/{mock_barcode_code}/**", handle_item_lookup
-        )
+        await mock_item_lookup(
+            mock_barcode_code,
+            item={
+                "id": 2,
+                "barcode": mock_barcode_code,
+                "title": "Braun Electric Shaver Series 9",
+                "description": "Professional electric shaver with precision technology",
+                "alias": "Shaver",
+                "brand": 2,
+            },
+            product_data={
+                "barcode": mock_barcode_code,
+                "title": "Braun Electric Shaver Series 9",
+                "brand": "Braun",
+                "category": "Personal Care",
+                "size": "Standard",
+                "quantity": "1",
+                "description": "Professional electric shaver with precision technology",
+            },
+        )
+
+        # Step 3: Navigate to barcode page
+        await _goto_barcode(authenticated_page)
 
         # Step 4: Verify page is set up for barcode detection
-        page_html = await authenticated_page.content()
-
         assert "/barcode" in authenticated_page.url, "Should be on barcode page"
-        assert (
-            "barcode" in page_html.lower() or "scanner" in page_html.lower()
-        ), "Page should have barcode scanner elements"
+        scanner_text = authenticated_page.get_by_text(
+            re.compile("barcode|scanner", re.IGNORECASE)
+        )
+        await expect(scanner_text.first).to_be_attached()
 
         # Step 5: Verify the mock setup is correct for auto-detection flow
         # (the actual auto-detection behavior is tested when integration tests run with real html5qrcode)
@@ -670,182 +437,146 @@ class TestBarcodeImageSubmissionFlow:
         # 4. And would receive product details to display
 
 
-class TestBarcodePageNavigation:
-    """Test navigation flows within and from barcode page."""
-
-    @pytest.mark.asyncio
-    async def test_barcode_page_title_visible(self, authenticated_page, db):
-        """Test that barcode page title is visible."""
-        # Create and login test user
-        await sync_to_async(User.objects.create_user)(
-            email="barcode_title@example.com", password="testpass123"
-        )
-
-        # Login
-        await authenticated_page.goto("http://localhost:3000/login")
-        await authenticated_page.fill("#email", "barcode_title@example.com")
-        await authenticated_page.fill("#password", "testpass123")
-        await authenticated_page.click('button[type="submit"]')
-        await authenticated_page.wait_for_url(
-            "http://localhost:3000/**", wait_until="domcontentloaded"
-        )
-
-        # Navigate to barcode page
-        await authenticated_page.goto(
-            "http://localhost:3000/barcode",
-            wait_until="domcontentloaded",
-        )
-
-        # Check for page title
-        h1 = await authenticated_page.query_selector("h1")
-        assert h1 is not None
-
-        # Check title content
-        title_text = await h1.text_content()
-        assert "Barcode Scanner" in title_text
-
-    @pytest.mark.asyncio
-    async def test_barcode_page_subtitle_visible(self, authenticated_page, db):
-        """Test that barcode page subtitle/description is visible."""
-        # Create and login test user
-        await sync_to_async(User.objects.create_user)(
-            email="barcode_subtitle@example.com", password="testpass123"
-        )
-
-        # Login
-        await authenticated_page.goto("http://localhost:3000/login")
-        await authenticated_page.fill("#email", "barcode_subtitle@example.com")
-        await authenticated_page.fill("#password", "testpass123")
-        await authenticated_page.click('button[type="submit"]')
-        await authenticated_page.wait_for_url(
-            "http://localhost:3000/**", wait_until="domcontentloaded"
-        )
-
-        # Navigate to barcode page
-        await authenticated_page.goto(
-            "http://localhost:3000/barcode",
-            wait_until="domcontentloaded",
-        )
-
-        # Check for subtitle/description
-        description = await authenticated_page.query_selector("p")
-        assert description is not None
-
-        desc_text = await description.text_content()
-        assert "camera" in desc_text.lower() or "barcode" in desc_text.lower()
-
-
 class TestBarcodeGeminiIntegration:
     """Test Gemini API integration for barcode processing."""
 
-    def _create_test_image(self) -> str:
-        """Create a simple test image and return as base64."""
-        # Create a simple test image
-        img = Image.new("RGB", (100, 100), color="red")
-        img_bytes = io.BytesIO()
-        img.save(img_bytes, format="JPEG")
-        img_bytes.seek(0)
-        # Return base64 encoded image
-        return base64.b64encode(img_bytes.getvalue()).decode("utf-8")
-
-    def test_barcode_processing_calls_gemini_api(self, authenticated_client, db_reset):
-        """Test that barcode processing makes a call to Gemini API."""
-        # Create test image
-        test_image_base64 = self._create_test_image()
-
-        # Mock the Gemini API response
-        mock_response = MagicMock()
-        mock_response.text = "123456789"  # Mock barcode code
-
+    @pytest.fixture(autouse=True)
+    def mock_generate(self):
+        """Patch Gemini for every test; tests set return_value or side_effect."""
         with patch(
-            "google.generativeai.GenerativeModel.generate_content",
-            return_value=mock_response,
+            "google.generativeai.GenerativeModel.generate_content"
         ) as mock_generate:
-            # Send barcode image to API
-            response = authenticated_client.post(
-                "/api/barcode/process/",
-                json={"image": test_image_base64},
-            )
+            yield mock_generate
+
+    @pytest.mark.parametrize(
+        "gemini_text, detected, barcode_code",
+        [
+            ("123456789", True, "123456789"),
+            ("UNABLE_TO_READ", False, "UNABLE_TO_READ"),
+            ("The barcode is 012345678905.", True, "012345678905"),
+            ("0 12345 67890 5", True, "012345678905"),
+            ("0-12345-67890-5", True, "012345678905"),
+        ],
+        ids=["code", "unable-to-read", "code-in-prose", "spaced", "hyphenated"],
+    )
+    def test_barcode_processing_returns_gemini_result(
+        self,
+        authenticated_client,
+        db_reset,
+        mock_generate,
+        gemini_text,
+        detected,
+        barcode_code,
+    ):
+        """Test that Gemini's reply is mapped to the detected flag and code."""
+        # Mock the Gemini API response
+        mock_generate.return_value = MagicMock(text=gemini_text)
 
-            # Verify successful response
-            assert response.status_code == 200
-            result = response.json()
-            assert result["detected"] is True
-            assert result["barcode_code"] == "123456789"
+        # Send barcode image to API
+        response = authenticated_client.post(
+            "/api/barcode/process/",
+            json={"image": TEST_IMAGE_BASE64},
+        )
+
+        # Verify successful response
+        assert response.status_code == 200
+        result = response.json()
+        assert result["detected"] is detected
+        assert result["barcode_code"] == barcode_code
 
-            # Verify Gemini was called
-            assert mock_generate.called
-            # Verify generate_content was called once
-            assert mock_generate.call_count == 1
+        # Verify generate_content was called once
+        assert mock_generate.call_count == 1
 
     def test_barcode_processing_gemini_receives_correct_prompt(
-        self, authenticated_client, db_reset
+        self, authenticated_client, db_reset, mock_generate
     ):
         """
         Test that Gemini API receives the correct barcode extraction prompt.
         """
-        # Create test image
-        test_image_base64 = self._create_test_image()
-
         # Mock the Gemini API response
-        mock_response = MagicMock()
-        mock_response.text = "987654321"
+        mock_generate.return_value = MagicMock(text="987654321")
 
-        with patch(
-            "google.generativeai.GenerativeModel.generate_content",
-            return_value=mock_response,
-        ) as mock_generate:
-            # Send barcode image
-            authenticated_client.post(
-                "/api/barcode/process/",
-                json={"image": test_image_base64},
-            )
+        # Send barcode image
+        authenticated_client.post(
+            "/api/barcode/process/",
+            json={"image": TEST_IMAGE_BASE64},
+        )
 
-            # Get the call arguments
-            call_args = mock_generate.call_args
-            assert call_args is not None
+        # Get the call arguments
+        call_args = mock_generate.call_args
+        assert call_args is not None
 
-            # Verify the prompt is included in the call
-            prompt_and_image = call_args[0][0]
-            assert isinstance(prompt_and_image, list)
-            assert len(prompt_and_image) == 2
+        # Verify the prompt is included in the call
+        prompt_and_image = call_args[0][0]
+        assert isinstance(prompt_and_image, list)
+        assert len(prompt_and_image) == 2
 
-            # First element should be the prompt
-            prompt = prompt_and_image[0]
-            assert "barcode" in prompt.lower()
-            assert "extract" in prompt.lower() or "analyze" in prompt.lower()
+        # First element should be the prompt
+        prompt = prompt_and_image[0]
+        assert "barcode" in prompt.lower()
+        assert "extract" in prompt.lower() or "analyze" in prompt.lower()
 
-    def test_barcode_processing_handles_gemini_unable_to_read(
-        self, authenticated_client, db_reset
+    def test_barcode_processing_accepts_multipart_upload(
+        self, authenticated_client, db_reset, mock_generate
     ):
-        """
-        Test barcode processing when Gemini cannot read barcode.
-        """
-        # Create test image
-        test_image_base64 = self._create_test_image()
+        """Test that an uploaded image file is processed without base64."""
+        # Upload raw JPEG bytes as a file
+        image_file = SimpleUploadedFile(
+            "barcode.jpg",
+            base64.b64decode(TEST_IMAGE_BASE64),
+            content_type="image/jpeg",
+        )
+        mock_generate.return_value = MagicMock(text="123456789")
 
-        # Mock Gemini response indicating unable to read
-        mock_response = MagicMock()
-        mock_response.text = "UNABLE_TO_READ"
+        # Use the raw Django client so the body is sent as multipart
+        response = authenticated_client.client.post(
+            "/api/barcode/process/",
+            {"image": image_file},
+        )
 
-        with patch(
-            "google.generativeai.GenerativeModel.generate_content",
-            return_value=mock_response,
-        ):
-            # Send barcode image
+        assert response.status_code == 200
+        assert response.json()["barcode_code"] == "123456789"
+
+    def test_barcode_processing_downscales_image_for_gemini(
+        self, authenticated_client, db_reset, mock_generate
+    ):
+        """Test that large images are downscaled to grayscale before Gemini."""
+        # Create a large test image
+        large_image_base64 = _create_test_image(size=(3000, 1500))
+        mock_generate.return_value = MagicMock(text="123456789")
+
+        response = authenticated_client.post(
+            "/api/barcode/process/",
+            json={"image": large_image_base64},
+        )
+
+        assert response.status_code == 200
+
+        # Verify the image Gemini received was shrunk to fit 1024x1024
+        sent_image = mock_generate.call_args[0][0][1]
+        assert sent_image.size == (1024, 512)
+        assert sent_image.mode == "L"
+
+    def test_barcode_processing_reuses_result_for_same_image(
+        self, authenticated_client, db_reset, mock_generate
+    ):
+        """Test that resubmitting the same image does not call Gemini again."""
+        mock_generate.return_value = MagicMock(text="123456789")
+
+        # Submit the same image twice (e.g. a client retry)
+        for _ in range(2):
             response = authenticated_client.post(
                 "/api/barcode/process/",
-                json={"image": test_image_base64},
+                json={"image": TEST_IMAGE_BASE64},
             )
-
-            # Verify response indicates barcode not detected
             assert response.status_code == 200
-            result = response.json()
-            assert result["detected"] is False
-            assert result["barcode_code"] == "UNABLE_TO_READ"
+            assert response.json()["barcode_code"] == "123456789"
+
+        # Verify Gemini was only called once
+        assert mock_generate.call_count == 1
 
     def test_barcode_processing_with_invalid_image_returns_error(
-        self, authenticated_client, db_reset
+        self, authenticated_client, db_reset, mock_generate
     ):
         """Test that invalid image data is rejected before calling Gemini."""
         # Send invalid base64 image data
@@ -858,83 +589,60 @@ class TestBarcodeGeminiIntegration:
         assert response.status_code == 400
         result = response.json()
         assert "error" in result
+        assert not mock_generate.called
 
     def test_barcode_processing_requires_authentication(self, http_client, db_reset):
         """Test that barcode processing endpoint requires authentication."""
-        # Create test image
-        test_image_base64 = self._create_test_image()
-
         # Try to access without authentication token
         response = http_client.post(
             "/api/barcode/process/",
-            json={"image": test_image_base64},
+            json={"image": TEST_IMAGE_BASE64},
         )
 
         # Should return 401 Unauthorized
         assert response.status_code == 401
 
     def test_barcode_processing_with_multiple_calls_to_gemini(
-        self, authenticated_client, db_reset
+        self, authenticated_client, db_reset, mock_generate
     ):
         """
         Test that multiple barcode submissions each call Gemini independently.
         """
-        # Create two test images
-        test_image_1 = self._create_test_image()
-        test_image_2 = self._create_test_image()
+        # Create two different test images
+        test_image_1 = TEST_IMAGE_BASE64
+        test_image_2 = _create_test_image(color="blue")
 
         # Mock responses for each call
-        def mock_generate_side_effect(args):
-            response = MagicMock()
-            if args[0] == 1:
-                response.text = "111111111"
-            else:
-                response.text = "222222222"
-            return response
-
-        mock_response_1 = MagicMock()
-        mock_response_1.text = "111111111"
-
-        mock_response_2 = MagicMock()
-        mock_response_2.text = "222222222"
+        mock_generate.side_effect = [
+            MagicMock(text="111111111"),
+            MagicMock(text="222222222"),
+        ]
 
-        with patch(
-            "google.generativeai.GenerativeModel.generate_content",
-            side_effect=[mock_response_1, mock_response_2],
-        ) as mock_generate:
-            # First request
-            response_1 = authenticated_client.post(
-                "/api/barcode/process/",
-                json={"image": test_image_1},
-            )
+        # First request
+        response_1 = authenticated_client.post(
+            "/api/barcode/process/",
+            json={"image": test_image_1},
+        )
 
-            assert response_1.status_code == 200
-            assert response_1.json()["barcode_code"] == "111111111"
+        assert response_1.status_code == 200
+        assert response_1.json()["barcode_code"] == "111111111"
 
-            # Second request
-            response_2 = authenticated_client.post(
-                "/api/barcode/process/",
-                json={"image": test_image_2},
-            )
+        # Second request
+        response_2 = authenticated_client.post(
+            "/api/barcode/process/",
+            json={"image": test_image_2},
+        )
 
-            assert response_2.status_code == 200
-            assert response_2.json()["barcode_code"] == "222222222"
+        assert response_2.status_code == 200
+        assert response_2.json()["barcode_code"] == "222222222"
 
-            # Verify Gemini was called twice
-            assert mock_generate.call_count == 2
+        # Verify Gemini was called twice
+        assert mock_generate.call_count == 2
 
 
 class TestBarcodeToProductIntegration:
     """Integration tests for complete barcode-to-product-details flow."""
 
-    def _create_test_image(self) -> str:
-        """Create a simple test image and return as base64."""
-        img = Image.new("RGB", (100, 100), color="red")
-        img_bytes = io.BytesIO()
-        img.save(img_bytes, format="JPEG")
-        img_bytes.seek(0)
-        return base64.b64encode(img_bytes.getvalue()).decode("utf-8")
-
     @pytest.mark.items
     def test_manual_capture_flow_barcode_and_product_lookup(
         self, authenticated_client, db_reset
@@ -948,7 +656,7 @@ class TestBarcodeToProductIntegration:
         3. All product information is returned to frontend
         """
         # Step 1: Create test image
-        test_image = self._create_test_image()
+        test_image = TEST_IMAGE_BASE64
 
         # Step 2: Mock Gemini to detect barcode
         mock_barcode_code = "5901234123457"
@@ -1143,8 +851,6 @@ class TestBarcodeToProductIntegration:
             assert data_2["item"]["id"] == item_id
 
             # Verify only one item exists
-            from django.db import connection
-
             with connection.cursor() as cursor:
                 cursor.execute(
                     "SELECT COUNT(*) FROM api_item WHERE barcode = %s",
@@ -0,0 +1,463 @@
+"""
+API-level end-to-end tests for item endpoints.
+
+Tests cover:
+- UPC lookup and item creation
+- Handling of existing items
+- Bulk item creation
+- Error cases (missing UPC, API failures)
+"""
+
+from unittest.mock import patch
+
+import pytest
+from django.core.cache import cache
+from upcdatabase import UPCDatabaseError
+
+from api.models import Item
+from api.views.items import BULK_CREATE_MAX_ITEMS
+
+# ============================================================================
+# Test Data
+# ============================================================================
+
+TEST_UPC = "0111222333446"
+
+EXPECTED_UPC_RESPONSE = {
+    "added_time": "2011-06-03 19:45:37",
+    "modified_time": "2020-03-17 14:59:12",
+    "title": "UPC Database Testing Code",
+    "alias": "Testing Code",
+    "description": "http://upcdatabase.org/code/0111222333446",
+    "brand": "",
+    "manufacturer": "",
+    "msrp": "123.45",
+    "ASIN": "",
+    "category": "",
+    "categories": "",
+    "stores": [],
+    "barcode": "0111222333446",
+    "success": True,
+    "timestamp": 1770332489,
+    "images": [],
+    "metadata": {"msrp": "123.45", "unit": "1 code"},
+    "metanutrition": None,
+}
+
+
+# ============================================================================
+# UPC Lookup Tests
+# ============================================================================
+
+
+@pytest.mark.items
+class TestItemsUPCLookup:
+    """Tests for the items UPC lookup endpoint."""
+
+    @patch("api.views.items.upcdatabase.UPCDatabase")
+    def test_lookup_upc_creates_new_item(
+        self, mock_upc_db_class, db_reset, authenticated_client
+    ):
+        """Test successful UPC lookup creates a new item."""
+        # Setup mock
+        mock_db_instance = mock_upc_db_class.return_value
+        mock_db_instance.lookup.return_value = EXPECTED_UPC_RESPONSE
+
+        # Ensure item doesn't exist
+        assert not Item.objects.filter(barcode=TEST_UPC).exists()
+
+        # Make request
+        response = authenticated_client.get(f"/api/items/{TEST_UPC}/")
+
+        # Verify response status
+        assert response.status_code == 201
+        data = response.json()
+
+        # Verify response structure
+        assert "created" in data
+        assert "item" in data
+        assert "product_data" in data
+
+        # Verify item was created
+        assert data["created"] is True
+        assert data["item"]["barcode"] == TEST_UPC
+        assert data["item"]["title"] == "UPC Database Testing Code"
+
+        # Verify product data matches expected response
+        assert data["product_data"]["barcode"] == TEST_UPC
+        assert data["product_data"]["title"] == "UPC Database Testing Code"
+
+        # Verify item exists in database
+        item = Item.objects.get(barcode=TEST_UPC)
+        assert item.title == "UPC Database Testing Code"
+        assert item.barcode == TEST_UPC
+
+    @patch("api.views.items.upcdatabase.UPCDatabase")
+    def test_lookup_upc_returns_existing_item(
+        self, mock_upc_db_class, db_reset, authenticated_client
+    ):
+        """Test UPC lookup returns existing item without creating duplicate."""
+        # Setup mock
+        mock_db_instance = mock_upc_db_class.return_value
+        mock_db_instance.lookup.return_value = EXPECTED_UPC_RESPONSE
+
+        # Create item first
+        existing_item = Item.objects.create(
+            barcode=TEST_UPC,
+            title="UPC Database Testing Code",
+            description="http://upcdatabase.org/code/0111222333446",
+            alias="",
+        )
+
+        # Make request
+        response = authenticated_client.get(f"/api/items/{TEST_UPC}/")
+
+        # Verify response status is 200 (not created)
+        assert response.status_code == 200
+        data = response.json()
+
+        # Verify item was not created again
+        assert data["created"] is False
+        assert data["item"]["id"] == existing_item.id
+        assert data["item"]["barcode"] == TEST_UPC
+
+        # Verify only one item exists in database
+        assert Item.objects.filter(barcode=TEST_UPC).count() == 1
+
+    def test_lookup_upc_without_upc_param(self, db_reset, authenticated_client):
+        """Test UPC lookup fails when UPC is not provided."""
+        response = authenticated_client.get("/api/items/")
+
+        # The bare items route only accepts POST, so the router answers 405
+        assert response.status_code == 405
+
+    @pytest.mark.parametrize(
+        "url", ["/api/items/{upc}/", "/api/items/lookup-product/{upc}/"]
+    )
+    @patch("api.views.items.upcdatabase.UPCDatabase")
+    def test_lookup_upc_too_long(
+        self, mock_upc_db_class, db_reset, authenticated_client, url
+    ):
+        """Test UPC lookups reject codes longer than 14 digits up front."""
+        response = authenticated_client.get(url.format(upc="1" * 15))
+
+        assert response.status_code == 400
+        assert "error" in response.json()
+
+        # The external API is never called for a code that cannot be stored
+        mock_upc_db_class.return_value.lookup.assert_not_called()
+        assert not Item.objects.exists()
+
+    @patch("api.views.items.upcdatabase.UPCDatabase")
+    def test_lookup_upc_not_found_in_database(
+        self, mock_upc_db_class, db_reset, authenticated_client
+    ):
+        """Test UPC lookup fails when product not found in UPC database."""
+        # Setup mock to return None
+        mock_db_instance = mock_upc_db_class.return_value
+        mock_db_instance.lookup.return_value = None
+
+        # Make request
+        response = authenticated_client.get(f"/api/items/{TEST_UPC}/")
+
+        # Verify response status
+        assert response.status_code == 404
+        data = response.json()
+
+        # Verify error message
+        assert "error" in data
+        assert f"No product found for UPC: {TEST_UPC}" in data["error"]
+
+        # Verify item was not created
+        assert not Item.objects.filter(barcode=TEST_UPC).exists()
+
+    @patch("api.views.items.upcdatabase.UPCDatabase")
+    def test_lookup_upc_api_error(
+        self, mock_upc_db_class, db_reset, authenticated_client
+    ):
+        """Test UPC lookup handles API errors gracefully."""
+        # Setup mock to raise exception
+        mock_db_instance = mock_upc_db_class.return_value
+        mock_db_instance.lookup.side_effect = Exception("API connection failed")
+
+        # Make request
+        response = authenticated_client.get(f"/api/items/{TEST_UPC}/")
+
+        # Verify response status
+        assert response.status_code == 500
+        data = response.json()
+
+        # Verify error message
+        assert "error" in data
+        assert "Failed to lookup UPC" in data["error"]
+        assert "API connection failed" in data["error"]
+
+    @patch("api.views.items.upcdatabase.UPCDatabase")
+    def test_lookup_upc_missing_api_key(
+        self, mock_upc_db_class, db_reset, authenticated_client
+    ):
+        """Test UPC lookup fails when API key is not configured."""
+        with patch("api.views.items.config") as mock_config:
+            # Mock config to return empty API key
+            mock_config.return_value = ""
+
+            # Make request
+            response = authenticated_client.get(f"/api/items/{TEST_UPC}/")
+
+            # Verify response status
+            assert response.status_code == 500
+            data = response.json()
+
+            # Verify error message
+            assert "error" in data
+            assert "UPCDATABASE_API_KEY environment variable not set" in data["error"]
+
+    @patch("api.views.items.upcdatabase.UPCDatabase")
+    def test_lookup_upc_response_structure(
+        self, mock_upc_db_class, db_reset, authenticated_client
+    ):
+        """Test UPC lookup response contains all required fields."""
+        # Setup mock
+        mock_db_instance = mock_upc_db_class.return_value
+        mock_db_instance.lookup.return_value = EXPECTED_UPC_RESPONSE
+
+        # Make request
+        response = authenticated_client.get(f"/api/items/{TEST_UPC}/")
+
+        # Verify response structure
+        assert response.status_code == 201
+        data = response.json()
+
+        # Verify top-level fields
+        assert "created" in data
+        assert "item" in data
+        assert "product_data" in data
+
+        # Verify item serialization includes expected fields
+        item = data["item"]
+        assert "id" in item
+        assert "barcode" in item
+        assert "title" in item
+        assert "description" in item
+        assert "alias" in item
+
+        # Verify product_data matches expected response
+        product_data = data["product_data"]
+        assert product_data["barcode"] == TEST_UPC
+        assert product_data["title"] == EXPECTED_UPC_RESPONSE["title"]
+        assert product_data["success"] is True
+
+    @patch("api.views.items.upcdatabase.UPCDatabase")
+    def test_lookup_upc_caches_external_lookup(
+        self, mock_upc_db_class, db_reset, authenticated_client
+    ):
+        """Test repeated UPC lookups are served from the cache."""
+        # Setup mock
+        mock_db_instance = mock_upc_db_class.return_value
+        mock_db_instance.lookup.return_value = EXPECTED_UPC_RESPONSE
+
+        # Scan the same UPC twice
+        response_1 = authenticated_client.get(f"/api/items/{TEST_UPC}/")
+        response_2 = authenticated_client.get(f"/api/items/{TEST_UPC}/")
+
+        assert response_1.status_code == 201
+        assert response_2.status_code == 200
+
+        # Only the first scan should reach the external API
+        assert mock_db_instance.lookup.call_count == 1
+
+    @patch("api.views.items.upcdatabase.UPCDatabase")
+    def test_lookup_upc_failed_lookup_not_cached_as_product(
+        self, mock_upc_db_class, db_reset, authenticated_client
+    ):
+        """Test a lookup answered with success false is not cached as a product."""
+        # Setup mock to return a failed lookup
+        mock_db_instance = mock_upc_db_class.return_value
+        mock_db_instance.lookup.return_value = {
+            "success": False,
+            "error": {"code": 301, "message": "Code does not exist"},
+        }
+
+        response = authenticated_client.get(f"/api/items/{TEST_UPC}/")
+
+        assert response.status_code == 404
+        assert not Item.objects.filter(barcode=TEST_UPC).exists()
+
+        # The failure is cached as a miss, not as product data
+        assert cache.get(f"upc:{TEST_UPC}") == ""
+
+    @patch("api.views.items.upcdatabase.UPCDatabase")
+    def test_lookup_upc_caches_unknown_upc(
+        self, mock_upc_db_class, db_reset, authenticated_client
+    ):
+        """Test repeated scans of an unknown UPC are served from the cache."""
+        # The client raises a 404 error for UPCs it does not know
+        mock_db_instance = mock_upc_db_class.return_value
+        mock_db_instance.lookup.side_effect = UPCDatabaseError(
+            'API request failed: 404 - {"success": false}'
+        )
+
+        # Scan the same UPC twice
+        response_1 = authenticated_client.get(f"/api/items/{TEST_UPC}/")
+        response_2 = authenticated_client.get(f"/api/items/{TEST_UPC}/")
+
+        assert response_1.status_code == 404
+        assert response_2.status_code == 404
+
+        # Only the first scan should reach the external API
+        assert mock_db_instance.lookup.call_count == 1
+
+    @patch("api.views.items.upcdatabase.UPCDatabase")
+    def test_lookup_upc_does_not_cache_api_errors(
+        self, mock_upc_db_class, db_reset, authenticated_client
+    ):
+        """Test errors other than not found are retried on the next scan."""
+        mock_db_instance = mock_upc_db_class.return_value
+        mock_db_instance.lookup.side_effect = UPCDatabaseError(
+            "Request failed: connection timed out"
+        )
+
+        response_1 = authenticated_client.get(f"/api/items/{TEST_UPC}/")
+        response_2 = authenticated_client.get(f"/api/items/{TEST_UPC}/")
+
+        assert response_1.status_code == 500
+        assert response_2.status_code == 500
+        assert mock_db_instance.lookup.call_count == 2
+
+
+# ============================================================================
+# Item Creation Tests
+# ============================================================================
+
+
+@pytest.mark.items
+class TestItemsCreate:
+    """Tests for the item creation endpoint."""
+
+    def test_create_item(self, db_reset, authenticated_client):
+        """Test creating a new item."""
+        response = authenticated_client.post(
+            "/api/items/",
+            json={"barcode": TEST_UPC, "title": "Test Item", "alias": "Test"},
+        )
+
+        assert response.status_code == 201
+        data = response.json()
+        assert data["barcode"] == TEST_UPC
+        assert data["title"] == "Test Item"
+        assert Item.objects.filter(barcode=TEST_UPC).count() == 1
+
+    def test_create_item_barcode_too_long(self, db_reset, authenticated_client):
+        """Test creating an item fails when the barcode exceeds 14 digits."""
+        response = authenticated_client.post(
+            "/api/items/",
+            json={"barcode": "1" * 15, "title": "Test Item"},
+        )
+
+        assert response.status_code == 400
+        assert "barcode" in response.json()
+        assert not Item.objects.exists()
+
+    def test_create_existing_item_updates_fields(self, db_reset, authenticated_client):
+        """Test posting an existing barcode updates the item in place."""
+        existing_item = Item.objects.create(barcode=TEST_UPC, title="Old Title")
+
+        response = authenticated_client.post(
+            "/api/items/",
+            json={
+                "barcode": TEST_UPC,
+                "title": "New Title",
+                "description": "New description",
+            },
+        )
+
+        assert response.status_code == 200
+        assert response.json()["id"] == existing_item.id
+
+        existing_item.refresh_from_db()
+        assert existing_item.title == "New Title"
+        assert existing_item.description == "New description"
+        assert Item.objects.filter(barcode=TEST_UPC).count() == 1
+
+    def test_bulk_create_items(self, db_reset, authenticated_client):
+        """Test creating several items in one request."""
+        Item.objects.create(barcode="012345678905", title="Existing Item")
+
+        response = authenticated_client.post(
+            "/api/items/bulk/",
+            json=[
+                {"barcode": TEST_UPC, "title": "Test Item"},
+                {"barcode": "012345678905", "title": "Ignored Title"},
+                {"barcode": "036000291452", "title": "Other Item", "alias": "Other"},
+            ],
+        )
+
+        assert response.status_code == 201
+        data = response.json()
+        assert len(data) == 3
+
+        # Existing items are left unchanged
+        assert Item.objects.get(barcode="012345678905").title == "Existing Item"
+        assert Item.objects.get(barcode="036000291452").alias == "Other"
+        assert Item.objects.count() == 3
+
+    def test_bulk_create_existing_items_returns_200(
+        self, db_reset, authenticated_client
+    ):
+        """Test bulk creation reports 200 when every item already exists."""
+        existing_item = Item.objects.create(barcode=TEST_UPC, title="Existing Item")
+
+        response = authenticated_client.post(
+            "/api/items/bulk/",
+            json=[{"barcode": TEST_UPC, "title": "Ignored Title"}],
+        )
+
+        assert response.status_code == 200
+        assert [item["id"] for item in response.json()] == [existing_item.id]
+
+    def test_bulk_create_items_requires_title(self, db_reset, authenticated_client):
+        """Test bulk creation fails without creating anything on invalid input."""
+        response = authenticated_client.post(
+            "/api/items/bulk/",
+            json=[
+                {"barcode": TEST_UPC, "title": "Test Item"},
+                {"barcode": "012345678905"},
+            ],
+        )
+
+        assert response.status_code == 400
+        assert "title" in response.json()
+        assert not Item.objects.exists()
+
+    @pytest.mark.parametrize(
+        "entry,field",
+        [
+            ({"barcode": TEST_UPC, "title": None}, "title"),
+            ({"barcode": None, "title": "Test Item"}, "barcode"),
+            ({"barcode": 12345678905, "title": "Test Item"}, "barcode"),
+            ({"barcode": TEST_UPC, "title": "Test Item", "alias": {}}, "alias"),
+        ],
+    )
+    def test_bulk_create_items_rejects_non_string_fields(
+        self, db_reset, authenticated_client, entry, field
+    ):
+        """Test bulk creation rejects nulls and other non-string values."""
+        response = authenticated_client.post("/api/items/bulk/", json=[entry])
+
+        assert response.status_code == 400
+        assert field in response.json()
+        assert not Item.objects.exists()
+
+    def test_bulk_create_items_rejects_oversized_batch(
+        self, db_reset, authenticated_client
+    ):
+        """Test bulk creation rejects more items than the batch limit."""
+        entries = [
+            {"barcode": str(barcode), "title": "Test Item"}
+            for barcode in range(BULK_CREATE_MAX_ITEMS + 1)
+        ]
+
+        response = authenticated_client.post("/api/items/bulk/", json=entries)
+
+        assert response.status_code == 400
+        assert not Item.objects.exists()